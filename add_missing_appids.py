@@ -1,18 +1,63 @@
 #!/usr/bin/env python3
+import array
+import bisect
 import json
 from pathlib import Path
 import argparse
 
+try:
+   import orjson
+except ImportError:
+   orjson = None
+
+try:
+   import ijson
+except ImportError:
+   ijson = None
+
 
 def load_json(path: Path):
    with path.open("r", encoding="utf-8-sig") as f:
       return json.load(f)
 
 
-def save_json(path: Path, data):
-   with path.open("w", encoding="utf-8") as f:
-      json.dump(data, f, ensure_ascii=False, indent=3)
-      f.write("\n")
+def iter_steam_apps(path: Path):
+   """Stream apps out of steam.json without materializing the whole tree."""
+   if ijson is None:
+      yield from load_json(path).get("applist", {}).get("apps", [])
+      return
+   with path.open("rb") as f:
+      yield from ijson.items(f, "applist.apps.item")
+
+
+def iter_map_entries(path: Path):
+   """Stream the [name, details] pairs of !.json one at a time."""
+   if ijson is None:
+      yield from load_json(path)
+      return
+   with path.open("rb") as f:
+      yield from ijson.items(f, "item")
+
+
+def _dump_app(app) -> bytes:
+   if orjson is not None:
+      return orjson.dumps(app)
+   return json.dumps(app, ensure_ascii=False).encode("utf-8")
+
+
+def save_json(path: Path, apps):
+   # The output shape is fixed ({"applist": {"apps": [...]}}), so stream it
+   # record by record: peak extra memory is one serialized app instead of
+   # the whole file as a single string.
+   with path.open("wb", buffering=1 << 20) as f:
+      f.write(b'{"applist": {"apps": [\n')
+      first = True
+      for app in apps:
+         if not first:
+            f.write(b",\n")
+         first = False
+         f.write(_dump_app(app))
+      f.write(b"\n]}}\n")
 
 
 def main():
@@ -26,17 +71,21 @@ def main():
    cache_path = Path(args.cache)
    out_path = Path(args.output) if args.output else cache_path
 
-   # Load !.json (array of [name, details])
-   entries = load_json(map_path)
+   # Stream !.json (array of [name, details]) and steam.json instead of
+   # json.load-ing whole trees; only the apps list itself stays resident.
+   entries = iter_map_entries(map_path)
+   apps = list(iter_steam_apps(cache_path))
 
-   # Load steam.json
-   cache = load_json(cache_path)
-   apps = cache.get("applist", {}).get("apps", [])
-
-   # Build quick lookup
-   existing = {int(app["appid"]) for app in apps if "appid" in app}
+   # Build quick lookup. A sorted array.array of appids + bisect is leaner
+   # than a set of boxed ints over ~200k entries, and it lets the final
+   # step be a linear merge instead of re-sorting the whole list of dicts.
+   ids_in_order = [int(app.get("appid", 0)) for app in apps]
+   already_sorted = all(a <= b for a, b in zip(ids_in_order, ids_in_order[1:]))
+   existing_ids = array.array("I", sorted(ids_in_order))
 
    added = 0
+   new_ids = array.array("I")
+   new_names = []
    for pair in entries:
       if not isinstance(pair, list) or len(pair) != 2:
          continue
@@ -57,21 +106,35 @@ def main():
       name = details["name"]
 
       # Skip if already present
-      if appid in existing:
+      pos = bisect.bisect_left(existing_ids, appid)
+      if pos < len(existing_ids) and existing_ids[pos] == appid:
          continue
 
-      # Add new entry
-      apps.append({
-         "appid": appid,
-         "name": name
-      })
-      existing.add(appid)
+      # Record new entry (SoA: ids + names), keeping the lookup array sorted
+      new_ids.append(appid)
+      new_names.append(name)
+      existing_ids.insert(pos, appid)
       added += 1
 
-   # Sort for consistency
-   apps.sort(key=lambda x: x["appid"])
-
-   save_json(out_path, cache)
+   # Merge for consistency: new entries are few, so sort only those and
+   # weave them into the (already sorted) cache list in one linear pass.
+   if not already_sorted:
+      ids_in_order.sort()
+      apps.sort(key=lambda x: int(x.get("appid", 0)))
+   if new_ids:
+      order = sorted(range(len(new_ids)), key=new_ids.__getitem__)
+      merged = []
+      i, n = 0, len(apps)
+      for j in order:
+         appid = new_ids[j]
+         while i < n and ids_in_order[i] <= appid:
+            merged.append(apps[i])
+            i += 1
+         merged.append({"appid": appid, "name": new_names[j]})
+      merged.extend(apps[i:])
+      apps = merged
+
+   save_json(out_path, apps)
 
    print(f"Added {added} new entries.")
    print(f"Written: {out_path}")
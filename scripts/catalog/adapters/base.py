@@ -5,15 +5,17 @@ from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Protocol
 
 import httpx
 
-from catalog.http import fetch, DomainLimiter, make_client
+from catalog.http import fetch, json_loads, DomainLimiter, make_client
 from catalog.models import GameRecord
 
 @dataclass(slots=True)
 class AdapterConfig:
    country: str = "US"
    locale: str = "en-US"
-   rps: float = 2.5              # requests per second for this domain
+   rps: float = 2.5              # sustained requests per second for this domain
+   burst: float = 8.0            # token-bucket capacity; short bursts above rps
    timeout: float = 30.0         # seconds
+   concurrency: int = 8          # max in-flight sources for concurrent crawl phases
 
 @dataclass(slots=True)
 class Capabilities:
@@ -58,7 +60,7 @@ class Adapter(abc.ABC):
       self.config = config or AdapterConfig()
       self._external_http = http
       self._http = http
-      self._limiter = limiter or DomainLimiter(self.config.rps)
+      self._limiter = limiter or DomainLimiter(self.config.rps, burst=self.config.burst)
       self.log = logger or logging.getLogger(f"catalog.{self.store}")
       # lightweight counters
       self.metrics: Dict[str, int] = {"fetched": 0, "parsed": 0, "quarantined": 0}
@@ -89,12 +91,18 @@ class Adapter(abc.ABC):
 
    async def get_json(self, url: str, **kw) -> Dict[str, Any]:
       r = await self.request("GET", url, **kw)
-      return r.json()
+      # Parse raw bytes so orjson (when installed) skips the str re-decode.
+      return json_loads(r.content)
 
    async def get_text(self, url: str, **kw) -> str:
       r = await self.request("GET", url, **kw)
       return r.text
 
+   async def get_bytes(self, url: str, **kw) -> bytes:
+      """Raw body, for callers that scan bytes and decode only fragments."""
+      r = await self.request("GET", url, **kw)
+      return r.content
+
    # -------- iterator contract ---------------------------------------------
 
    @abc.abstractmethod
@@ -108,6 +116,28 @@ class Adapter(abc.ABC):
       """
       ...
 
+   async def iter_games_soa(self, *, chunk_size: int = 1024) -> AsyncIterator[Dict[str, List[Any]]]:
+      """
+      Yield iter_games() output as column-oriented chunks (dict of lists).
+
+      Batch consumers that only need a column or two — exports, cross-store
+      merges like add_missing_appids — can read columns directly instead of
+      touching one GameRecord object per row.
+      """
+      fields = tuple(GameRecord.model_fields)
+      columns: Dict[str, List[Any]] = {f: [] for f in fields}
+      count = 0
+      async for rec in self.iter_games():
+         for f in fields:
+            columns[f].append(getattr(rec, f))
+         count += 1
+         if count >= chunk_size:
+            yield columns
+            columns = {f: [] for f in fields}
+            count = 0
+      if count:
+         yield columns
+
    def resume(self, records: List[GameRecord]) -> None:
       """Adapters can override to optimize when resuming from cached records."""
       return None
@@ -136,6 +166,50 @@ class Adapter(abc.ABC):
       self.metrics["parsed"] += 1
       return RecordResult(ok=True, record=record, raw=raw)
 
+   async def merge_streams(
+      self,
+      sources,
+      *,
+      concurrency: int | None = None,
+   ) -> AsyncIterator[Any]:
+      """
+      Drain several async iterators concurrently, yielding items as they arrive.
+
+      The number of sources iterated at once is bounded by *concurrency*
+      (default: self.config.concurrency); request pacing stays with the
+      per-domain limiter, so fanning out is safe.
+      """
+      queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+      sem = asyncio.Semaphore(concurrency or self.config.concurrency)
+      sentinel = object()
+
+      async def worker(source) -> None:
+         async with sem:
+            async for item in source:
+               await queue.put(item)
+
+      tasks = [asyncio.create_task(worker(source)) for source in sources]
+
+      async def pump() -> None:
+         try:
+            await asyncio.gather(*tasks)
+         finally:
+            await queue.put(sentinel)
+
+      pump_task = asyncio.create_task(pump())
+      try:
+         while True:
+            item = await queue.get()
+            if item is sentinel:
+               break
+            yield item
+         # surface any worker exception
+         await pump_task
+      finally:
+         pump_task.cancel()
+         for task in tasks:
+            task.cancel()
+
    async def paginate(
       self,
       *,
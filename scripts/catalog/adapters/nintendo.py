@@ -1,10 +1,19 @@
 from __future__ import annotations
 import asyncio
+import concurrent.futures
+import io
 import json
+import os
 import re
-from urllib.parse import quote_plus
 from dataclasses import dataclass, field
-from typing import AsyncIterator, Dict, Any, List, Optional, Set
+from types import MappingProxyType
+from urllib.parse import quote_plus, urlencode
+from typing import AsyncIterator, Dict, Any, Iterator, List, Optional, Set
+
+try:
+   import ijson
+except ImportError:
+   ijson = None
 
 from catalog.adapters.base import Adapter, AdapterConfig, Capabilities
 from catalog.models import GameRecord
@@ -15,7 +24,7 @@ from catalog.normalize import (
    normalize_platforms,
    normalize_rating,
 )
-from catalog.http import DomainLimiter
+from catalog.http import DomainLimiter, json_loads
 
 # Nintendo's public surface varies by region and frequently embeds data in the page.
 # Strategy:
@@ -28,55 +37,355 @@ from catalog.http import DomainLimiter
 
 NIN_LIMIT = DomainLimiter(2.0)
 
-_JSONLD_RE = re.compile(
-   r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
-   re.S | re.I
-)
 _NEXT_RE = re.compile(
    r'<script[^>]+id=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>',
    re.S | re.I
 )
 
+# Literal sentinels for the fast script-extraction path. `str.find` on a fixed
+# substring runs at memchr speed, so the common case never touches the regex
+# engine; the compiled patterns above remain as a fallback for odd markup.
+_NEXT_SENTINEL = '__NEXT_DATA__'
+_JSONLD_SENTINEL = 'application/ld+json'
+_SCRIPT_CLOSE = '</script>'
+
+# Bytes twins: pages are scanned undecoded and only the JSON fragments (a few
+# percent of a multi-MB page) ever pay for UTF-8 decoding.
+_NEXT_SENTINEL_B = _NEXT_SENTINEL.encode()
+_JSONLD_SENTINEL_B = _JSONLD_SENTINEL.encode()
+_SCRIPT_CLOSE_B = _SCRIPT_CLOSE.encode()
+_NEXT_RE_B = re.compile(
+   rb'<script[^>]+id=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>',
+   re.S | re.I
+)
+
+def _find_next_data_payload(html: str) -> Optional[str]:
+   i = html.find(_NEXT_SENTINEL)
+   if i < 0:
+      return None
+   j = html.find(">", i)
+   if j < 0:
+      return None
+   k = html.find(_SCRIPT_CLOSE, j + 1)
+   if k < 0:
+      return None
+   return html[j + 1:k]
+
+def _iter_jsonld_payloads(html: str):
+   pos = 0
+   while True:
+      i = html.find(_JSONLD_SENTINEL, pos)
+      if i < 0:
+         return
+      j = html.find(">", i)
+      if j < 0:
+         return
+      k = html.find(_SCRIPT_CLOSE, j + 1)
+      if k < 0:
+         return
+      yield html[j + 1:k]
+      pos = k + len(_SCRIPT_CLOSE)
+
+def _iter_script_payloads(html) -> Iterator[tuple[str, Any]]:
+   """
+   Single pass over <script> tags, yielding ('next'|'jsonld', body) pairs.
+
+   Routing on the opening tag's attributes lets one traversal feed both
+   extraction strategies instead of re-scanning the document per sentinel.
+   Accepts str or bytes; bodies are yielded in the input's type so only the
+   JSON fragments ever get decoded downstream.
+   """
+   if isinstance(html, bytes):
+      open_tag, gt = b"<script", b">"
+      close, next_sentinel, jsonld_sentinel = (
+         _SCRIPT_CLOSE_B, _NEXT_SENTINEL_B, _JSONLD_SENTINEL_B)
+   else:
+      open_tag, gt = "<script", ">"
+      close, next_sentinel, jsonld_sentinel = (
+         _SCRIPT_CLOSE, _NEXT_SENTINEL, _JSONLD_SENTINEL)
+   pos = 0
+   find = html.find
+   while True:
+      i = find(open_tag, pos)
+      if i < 0:
+         return
+      j = find(gt, i)
+      if j < 0:
+         return
+      k = find(close, j + 1)
+      if k < 0:
+         return
+      attrs = html[i:j]
+      if next_sentinel in attrs:
+         yield "next", html[j + 1:k]
+      elif jsonld_sentinel in attrs:
+         yield "jsonld", html[j + 1:k]
+      pos = k + len(close)
+
 _ASSET_HOST = "https://assets.nintendo.com"
 
+# Fallback key orders for the heterogeneous item shapes we normalize.
+_NAME_KEYS = ("title", "name", "productTitle")
+_ID_KEYS = ("nsuid", "id", "productId")
+_IMAGE_KEYS = ("image", "imageUrl", "boxArt", "heroBanner", "productImage", "productImageSquare")
+_IMAGE_LIST_KEYS = ("images", "keyImages")
+_HREF_KEYS = ("productUrl", "url", "webUrl")
+_PRICE_AMOUNT_KEYS = ("discounted", "current", "regular", "amount")
+_ALGOLIA_IMAGE_KEYS = ("boxArt", "heroBanner", "image", "productImage", "productImageSquare")
+_DISPLAY_PRICE_KEYS = ("priceDisplay", "price_display", "priceText")
+_RATING_KEYS = ("rating", "esrb", "ageRating", "contentRating")
+_TILE_LINK_KEYS = ("url", "href", "productUrl")
+_TILE_PRICE_KEYS = ("price", "displayPrice", "priceDisplay")
+_JSONLD_ID_KEYS = ("sku", "productID", "mpn")
+
+def _first(get, keys):
+   """Return the first truthy value among *keys* via a bound dict.get."""
+   for k in keys:
+      v = get(k)
+      if v:
+         return v
+   return None
+
+# Default extra params for the single-index Algolia endpoint. Read-only view:
+# __init__ hands each instance a shallow copy rather than rebuilding the
+# literal per construction.
+_DEFAULT_ALGOLIA_PARAMS = MappingProxyType({
+   "analytics": True,
+   "facetingAfterDistinct": True,
+   "clickAnalytics": True,
+   "highlightPreTag": "^*^^",
+   "highlightPostTag": "^*",
+   "attributesToHighlight": ["description"],
+   "facets": ["*"],
+   "maxValuesPerFacet": 100,
+})
+
+# One /queries request entry, pre-serialized; only index/query/size/page vary
+# (plus a per-adapter static suffix), so bytes %-interpolation replaces a dict
+# build + JSON encode per page.
+_ALGOLIA_REQ_TMPL = b'{"indexName":"%b","params":"query=%b&hitsPerPage=%b&page=%b%b"}'
+
+def _algolia_param_str(value: Any) -> str:
+   """Stringify one Algolia param for urlencode (arrays/objects go as JSON)."""
+   if isinstance(value, str):
+      return value
+   if isinstance(value, bool):
+      return "true" if value else "false"
+   if isinstance(value, (int, float)):
+      return str(value)
+   return json.dumps(value, separators=(",", ":"))
+
+# Keys under which Next.js trees stash product arrays.
+_NEXT_ITEM_KEYS = ("products", "items", "results", "tiles")
+_NEXT_ITEM_KEYS_SET = frozenset(_NEXT_ITEM_KEYS)
+_NEXT_ITEM_SUFFIXES = tuple(f"{key}.item" for key in _NEXT_ITEM_KEYS)
+_NEXT_ITEM_DOTTED = tuple(f".{suffix}" for suffix in _NEXT_ITEM_SUFFIXES)
+
+def _walk_product_items(o: Any) -> Iterator[Any]:
+   """Yield raw entries of every product-ish array nested anywhere in *o*."""
+   # Next.js trees run tens of thousands of nodes deep; an explicit stack
+   # avoids a Python frame per node.
+   item_keys = _NEXT_ITEM_KEYS
+   skip = _NEXT_ITEM_KEYS_SET
+   stack = [o]
+   pop = stack.pop
+   push = stack.extend
+   while stack:
+      node = pop()
+      if isinstance(node, dict):
+         get = node.get
+         for key in item_keys:
+            v = get(key)
+            if isinstance(v, list):
+               yield from v
+         # Arrays just yielded are already candidates; descending into them
+         # again traversed every matching list twice.
+         for k, v in node.items():
+            if k in skip and isinstance(v, list):
+               continue
+            stack.append(v)
+      elif isinstance(node, list):
+         push(node)
+
+def _stream_next_data_items(payload) -> Iterator[Dict[str, Any]]:
+   """Stream dicts out of product arrays without materializing the full tree."""
+   if not isinstance(payload, bytes):
+      payload = payload.encode("utf-8")
+   builder = None
+   depth = 0
+   for prefix, event, value in ijson.parse(io.BytesIO(payload)):
+      if builder is not None:
+         builder.event(event, value)
+         if event in ("start_map", "start_array"):
+            depth += 1
+         elif event in ("end_map", "end_array"):
+            depth -= 1
+            if depth == 0:
+               item = builder.value
+               builder = None
+               if isinstance(item, dict):
+                  yield item
+      elif event == "start_map" and (
+         prefix in _NEXT_ITEM_SUFFIXES or prefix.endswith(_NEXT_ITEM_DOTTED)
+      ):
+         builder = ijson.ObjectBuilder()
+         builder.event(event, value)
+         depth = 1
+
+def _iter_next_data_items(payload) -> Iterator[Any]:
+   """
+   Yield candidate product dicts from a __NEXT_DATA__ payload.
+
+   With ijson available only the matching product arrays are materialized;
+   otherwise the whole payload is parsed and walked.
+   """
+   if ijson is not None:
+      for item in _stream_next_data_items(payload):
+         yield item
+         # Tiles can nest further product arrays of their own.
+         yield from _walk_product_items(item)
+      return
+   try:
+      js = json_loads(payload)
+   except Exception:
+      return
+   yield from _walk_product_items(js)
+
+def _extract_next_items(html: str) -> List[Any]:
+   """Decode the __NEXT_DATA__ payload and collect raw product candidates."""
+   payload = _find_next_data_payload(html)
+   if payload is None:
+      # The pattern contains the sentinel literal, so it cannot match on a
+      # page where the fast scan saw no sentinel; only retry odd markup.
+      if _NEXT_SENTINEL not in html:
+         return []
+      m = _NEXT_RE.search(html)
+      if not m:
+         return []
+      payload = m.group(1)
+   try:
+      return list(_iter_next_data_items(payload))
+   except Exception:
+      return []
+
+_WANTED_TYPES = frozenset({"product", "videogame"})
+
+def _collect_jsonld_blocks(payload, out: List[Dict[str, Any]]) -> None:
+   """Decode one JSON-LD payload and append its Product/VideoGame blocks."""
+   # Most JSON-LD on these pages is breadcrumbs/organization noise; a
+   # substring test rejects those without paying for a JSON parse.
+   if isinstance(payload, bytes):
+      if b"Product" not in payload and b"VideoGame" not in payload:
+         return
+   elif "Product" not in payload and "VideoGame" not in payload:
+      return
+   try:
+      block = json_loads(payload)
+   except Exception:
+      return
+   blocks = block if isinstance(block, list) else [block]
+   for b in blocks:
+      if not isinstance(b, dict):
+         continue
+      # Accept Product/VideoGame schemas, or walk @graph
+      if "@graph" in b and isinstance(b["@graph"], list):
+         for g in b["@graph"]:
+            if isinstance(g, dict) and str(g.get("@type", "")).lower() in _WANTED_TYPES:
+               out.append(g)
+      elif str(b.get("@type", "")).lower() in _WANTED_TYPES:
+         out.append(b)
+
+def _extract_jsonld_blocks(html: str) -> List[Dict[str, Any]]:
+   """Decode JSON-LD scripts and collect Product/VideoGame blocks."""
+   out: List[Dict[str, Any]] = []
+   for payload in _iter_jsonld_payloads(html):
+      _collect_jsonld_blocks(payload, out)
+   return out
+
+def _extract_raw_items(html) -> tuple[List[Any], List[Dict[str, Any]]]:
+   """
+   CPU-bound extraction of embedded JSON from a listing page.
+
+   Top-level and side-effect free so it can run in a worker process;
+   normalization, which needs adapter state, stays on the event loop.
+   One script-tag scan feeds both strategies.
+   """
+   next_items: List[Any] = []
+   jsonld_blocks: List[Dict[str, Any]] = []
+   saw_next = False
+   for kind, payload in _iter_script_payloads(html):
+      if kind == "next":
+         saw_next = True
+         try:
+            next_items.extend(_iter_next_data_items(payload))
+         except Exception:
+            pass
+      else:
+         _collect_jsonld_blocks(payload, jsonld_blocks)
+   is_bytes = isinstance(html, bytes)
+   if not saw_next and (_NEXT_SENTINEL_B if is_bytes else _NEXT_SENTINEL) in html:
+      # Odd markup (sentinel outside a script attribute): regex fallback.
+      if is_bytes:
+         m = _NEXT_RE_B.search(html)
+         if m:
+            try:
+               next_items = list(_iter_next_data_items(m.group(1)))
+            except Exception:
+               pass
+      else:
+         next_items = _extract_next_items(html)
+   return next_items, jsonld_blocks
+
 def _normalize_asset_url(value: Optional[str]) -> Optional[str]:
-   if not value:
+   if not value or not isinstance(value, str):
       return value
-   if isinstance(value, str):
-      if value.startswith("http://") or value.startswith("https://"):
-         return value
-      if value.startswith("//"):
-         return f"https:{value}"
-      path = value.lstrip("/")
-      if path.startswith("image/upload/"):
-         return f"{_ASSET_HOST}/{path}"
-      return f"{_ASSET_HOST}/image/upload/{path}"
-   return value
+   # Nintendo assets are usually absolute already; the tuple startswith
+   # settles the common case in one C-level call.
+   if value.startswith(("http://", "https://")):
+      return value
+   if value.startswith("//"):
+      return f"https:{value}"
+   path = value.lstrip("/")
+   if path.startswith("image/upload/"):
+      return f"{_ASSET_HOST}/{path}"
+   return f"{_ASSET_HOST}/image/upload/{path}"
+
+# Price fields worth descending into, in preference order; the reversed copy
+# exists so stack pushes pop back out in the same order.
+_PRICE_KEYS = (
+   "finalPrice", "salePrice", "discountPrice", "discounted", "regularPrice", "regPrice",
+   "current", "amount", "raw", "value", "price", "msrp", "final", "basePrice", "usdValue",
+)
+_PRICE_KEYS_REV = tuple(reversed(_PRICE_KEYS))
+
+# Currency noise stripped from string prices in one C pass (str.translate)
+# instead of a .replace chain that rescans and reallocates per character.
+_PRICE_STRIP = str.maketrans("", "", "$,€£¥ ")
 
 def _extract_price_components(*values: Any) -> tuple[Optional[float], Optional[str], Optional[str]]:
    amount: Optional[float] = None
    currency: Optional[str] = None
    display: Optional[str] = None
 
-   def visit(node: Any):
-      nonlocal amount, currency, display
-      if node is None or (amount is not None and currency is not None and display is not None):
-         return
-      if isinstance(node, bool):
-         return
-      if isinstance(node, (int, float)) and not isinstance(node, bool):
+   # Iterative depth-first walk (reversed pushes preserve visit order) with
+   # an early exit once all three components are filled.
+   stack = [v for v in reversed(values) if v is not None]
+   while stack:
+      node = stack.pop()
+      if node is None or isinstance(node, bool):
+         continue
+      if isinstance(node, (int, float)):
          if amount is None:
             amt = float(node)
             if amt > 1000:
                amt = amt / 100.0
             amount = amt
-         return
-      if isinstance(node, str):
+      elif isinstance(node, str):
          stripped = node.strip()
          if not stripped:
-            return
+            continue
          try:
-            amt = float(stripped.replace("$", "").replace(",", ""))
+            amt = float(stripped.translate(_PRICE_STRIP))
          except ValueError:
             if display is None:
                display = stripped
@@ -85,25 +394,22 @@ def _extract_price_components(*values: Any) -> tuple[Optional[float], Optional[s
                if amt > 1000:
                   amt = amt / 100.0
                amount = amt
-         return
-      if isinstance(node, dict):
+      elif isinstance(node, dict):
+         get = node.get
          if currency is None:
-            currency = node.get("currency") or node.get("currencyCode") or node.get("currency_symbol")
+            currency = get("currency") or get("currencyCode") or get("currency_symbol")
          if display is None:
-            display = node.get("display") or node.get("formatted") or node.get("rawValue") or node.get("priceFormatted")
-         for key in (
-            "finalPrice", "salePrice", "discountPrice", "discounted", "regularPrice", "regPrice",
-            "current", "amount", "raw", "value", "price", "msrp", "final", "basePrice", "usdValue",
-         ):
-            if key in node:
-               visit(node.get(key))
-         return
-      if isinstance(node, (list, tuple, set)):
-         for item in node:
-            visit(item)
-
-   for v in values:
-      visit(v)
+            display = get("display") or get("formatted") or get("rawValue") or get("priceFormatted")
+         for key in _PRICE_KEYS_REV:
+            v = get(key)
+            if v is not None:
+               stack.append(v)
+      elif isinstance(node, (list, tuple)):
+         stack.extend(reversed(node))
+      elif isinstance(node, set):
+         stack.extend(node)
+      if amount is not None and currency is not None and display is not None:
+         break
 
    return amount, currency, display
 
@@ -150,37 +456,72 @@ class NintendoAdapter(Adapter):
          algolia_api_key="a29c6927638bfd8cee23993e51e721c9",
          algolia_index="store_game_{locale}_{country}_release_des",
          algolia_filters="NOT \"contentDescriptors.label\":\"Partial Nudity\" AND NOT \"contentDescriptors.label\":\"Nudity\"",
-         algolia_additional_params={
-            "analytics": True,
-            "facetingAfterDistinct": True,
-            "clickAnalytics": True,
-            "highlightPreTag": "^*^^",
-            "highlightPostTag": "^*",
-            "attributesToHighlight": ["description"],
-            "facets": ["*"],
-            "maxValuesPerFacet": 100,
-         },
+         algolia_additional_params=dict(_DEFAULT_ALGOLIA_PARAMS),
          seed_pages=_default_seed_pages(self.config.country, self.config.locale),
       )
       self._resume_keys: Set[str] = set()
+      # Locale/country strings reused per item and per page; compute once.
+      self._loc = self.config.locale.replace("_", "-").lower()
+      self._loc_underscore = self.config.locale.replace("-", "_").lower()
+      self._country_lower = self.config.country.lower()
+      self._slug_base = f"https://www.nintendo.com/{self._loc}/store/products/"
+      self._algolia_body_tmpl = b'{"requests":[' + _ALGOLIA_REQ_TMPL + b"]}"
+      # Filters/extra params don't vary per page; encode them once so the
+      # /queries branch sends them too instead of silently dropping them.
+      static_params: Dict[str, str] = {}
+      if self.endpoints.algolia_filters:
+         static_params["filters"] = self.endpoints.algolia_filters
+      for k, v in (self.endpoints.algolia_additional_params or {}).items():
+         static_params[k] = _algolia_param_str(v)
+      self._algolia_static_suffix = (
+         ("&" + urlencode(static_params, quote_via=quote_plus)).encode()
+         if static_params else b""
+      )
+      # Endpoint/index/header resolution never changes after construction.
+      self._search_ctx = self._resolve_search_context()
+      # Dedup guards applied before normalization: seed pages overlap a lot,
+      # and Algolia letter searches repeat multi-word titles across letters.
+      self._seen_ids: Set[str] = set()
+      self._seen_name_href: Set[int] = set()
+      # Created lazily by _ensure_parse_pool; only list-page crawls need it.
+      self._parse_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+   async def __aexit__(self, exc_type, exc, tb):
+      if self._parse_pool is not None:
+         self._parse_pool.shutdown(wait=False, cancel_futures=True)
+         self._parse_pool = None
+      await super().__aexit__(exc_type, exc, tb)
+
+   # Strategy A yields above this → the index sweep covered the catalog and
+   # the seed-page HTML crawl would only re-download known records.
+   _SEED_SKIP_THRESHOLD = 1000
 
    async def iter_games(self) -> AsyncIterator[GameRecord]:
       seen: Set[str] = set()
 
-      # Strategy A: JSON search (optional)
+      # Strategy A: JSON search (optional). Algolia treats an empty query as
+      # match-all, so one paginated sweep enumerates the whole index — the
+      # old a-z letter scan refetched heavily overlapping result sets.
+      # _iter_search_api_batch remains for callers that need several
+      # targeted queries against a /queries endpoint.
+      yielded_a = 0
       if self.endpoints.search_api:
-         for ch in "abcdefghijklmnopqrstuvwxyz":
-            async for rec in self._iter_search_api(query=ch, page_size=60):
-               if rec and self._should_emit(rec, seen):
-                  yield rec
-         await asyncio.sleep(0.1)
-
-      # Strategy B: Listing pages with embedded JSON
-      for url in self.endpoints.seed_pages or []:
-         async for rec in self._iter_list_page(url):
+         async for rec in self._iter_search_api(query="", page_size=1000):
             if rec and self._should_emit(rec, seen):
+               yielded_a += 1
                yield rec
-         await asyncio.sleep(0.2)
+
+      # Strategy B: Listing pages with embedded JSON. Skipped entirely when
+      # the sweep already produced a catalog-sized result; the seed pages are
+      # multi-MB downloads that would dedupe to nothing.
+      if yielded_a > self._SEED_SKIP_THRESHOLD:
+         return
+      sources = [self._iter_list_page(url) for url in self.endpoints.seed_pages or []]
+      if not sources:
+         return
+      async for rec in self.merge_streams(sources):
+         if rec and self._should_emit(rec, seen):
+            yield rec
 
    def resume(self, records: List[GameRecord]) -> None:
       super().resume(records)
@@ -214,17 +555,20 @@ class NintendoAdapter(Adapter):
 
    # ---------- Strategy A: JSON search API (optional) ----------
 
-   async def _iter_search_api(self, *, query: str, page_size: int = 60) -> AsyncIterator[Optional[GameRecord]]:
-      assert self.endpoints.search_api, "search_api endpoint template not configured"
+   def _search_context(self) -> tuple[str, str, bool, Dict[str, str]]:
+      """Return the (resolved-once) Algolia endpoint/index/headers tuple."""
+      return self._search_ctx
 
+   def _resolve_search_context(self) -> tuple[str, str, bool, Dict[str, str]]:
+      """Resolve the Algolia endpoint/index/headers for search requests."""
       headers = {"Accept": "application/json"}
       if self.endpoints.algolia_app_id:
          headers["X-Algolia-Application-Id"] = self.endpoints.algolia_app_id
       if self.endpoints.algolia_api_key:
          headers["X-Algolia-Api-Key"] = self.endpoints.algolia_api_key
 
-      locale_underscore = self.config.locale.replace("-", "_").lower()
-      country_lower = self.config.country.lower()
+      locale_underscore = self._loc_underscore
+      country_lower = self._country_lower
       index_template = self.endpoints.algolia_index or "ncom_game_en_{country}"
       index_name = index_template.format(
          country=country_lower,
@@ -239,33 +583,31 @@ class NintendoAdapter(Adapter):
       if "{index_name}" in search_api or "{index}" in search_api:
          search_api = search_api.format(index=index_name, index_name=index_name)
       using_queries = search_api.endswith("/queries")
+      return search_api, index_name, using_queries, headers
 
-      page = 0
-      while True:
-         if using_queries:
-            params = {
-               "query": query,
-               "hitsPerPage": str(page_size),
-               "page": str(page),
-            }
-            payload = {
-               "requests": [
-                  {
-                     "indexName": index_name,
-                     "params": "&".join(f"{k}={quote_plus(v)}" for k, v in params.items()),
-                  }
-               ]
-            }
-            resp = await self.request("POST", search_api, json=payload, headers=headers)
-            js = resp.json()
-            results = (js.get("results") or [])
-            if results:
-               items = results[0].get("hits") or []
-               nb_pages = results[0].get("nbPages")
-            else:
-               items = []
-               nb_pages = None
-         else:
+   async def _iter_search_api(self, *, query: str, page_size: int = 60) -> AsyncIterator[Optional[GameRecord]]:
+      assert self.endpoints.search_api, "search_api endpoint template not configured"
+
+      search_api, index_name, using_queries, headers = self._search_context()
+
+      if using_queries:
+         # The body structure is fixed; fill the pre-serialized template and
+         # skip the per-page dict build and JSON encode. Queries are single
+         # ASCII letters, so no URL encoding is needed either.
+         post_headers = {**headers, "Content-Type": "application/json"}
+         body_tmpl = self._algolia_body_tmpl
+         index_b = index_name.encode()
+         query_b = query.encode()
+         size_b = str(page_size).encode()
+         suffix_b = self._algolia_static_suffix
+
+         def fetch_page(page: int) -> asyncio.Task:
+            body = body_tmpl % (index_b, query_b, size_b, str(page).encode(), suffix_b)
+            return asyncio.create_task(
+               self.request("POST", search_api, content=body, headers=post_headers)
+            )
+      else:
+         def build_payload(page: int) -> Dict[str, Any]:
             payload = {
                "query": query,
                "hitsPerPage": page_size,
@@ -275,26 +617,110 @@ class NintendoAdapter(Adapter):
                payload["filters"] = self.endpoints.algolia_filters
             if self.endpoints.algolia_additional_params:
                payload.update(self.endpoints.algolia_additional_params)
-            resp = await self.request("POST", search_api, json=payload, headers=headers)
-            js = resp.json()
-            items = js.get("hits") or []
-            nb_pages = js.get("nbPages")
-
-         count = 0
-         for it in items:
-            coalesced = self._coerce_algolia_hit(it)
-            rec = self._normalize_api_item(coalesced)
-            if rec:
-               count += 1
-               yield rec
+            return payload
+
+         def fetch_page(page: int) -> asyncio.Task:
+            return asyncio.create_task(
+               self.request("POST", search_api, json=build_payload(page), headers=headers)
+            )
+
+      def discard(task: Optional[asyncio.Task]) -> None:
+         if task is None:
+            return
+         if task.done():
+            if not task.cancelled():
+               task.exception()  # retrieve, so dropped lookaheads don't warn
+         else:
+            task.cancel()
+
+      page = 0
+      current: Optional[asyncio.Task] = fetch_page(0)
+      prefetch: Optional[asyncio.Task] = None
+      try:
+         while True:
+            resp = await current
+            # Keep the next page's POST in flight while this one is parsed
+            # and its records are yielded; hides one RTT per page.
+            prefetch = fetch_page(page + 1)
+            js = json_loads(resp.content)
+            if using_queries:
+               results = (js.get("results") or [])
+               if results:
+                  items = results[0].get("hits") or []
+                  nb_pages = results[0].get("nbPages")
+               else:
+                  items = []
+                  nb_pages = None
+            else:
+               items = js.get("hits") or []
+               nb_pages = js.get("nbPages")
+
+            count = 0
+            for it in items:
+               coalesced = self._coerce_algolia_hit(it)
+               rec = self._normalize_api_item(coalesced)
+               if rec:
+                  count += 1
+                  yield rec
 
-         if nb_pages is not None:
-            if page + 1 >= nb_pages:
+            if nb_pages is not None:
+               if page + 1 >= nb_pages:
+                  break
+            if count < page_size:
                break
-         if count < page_size:
-            break
+            page += 1
+            current, prefetch = prefetch, None
+      finally:
+         discard(prefetch)
+         discard(current)
+
+   async def _iter_search_api_batch(self, *, queries: List[str], page_size: int = 60) -> AsyncIterator[Optional[GameRecord]]:
+      """
+      Paginate several queries with one POST per page via Algolia's
+      multi-query endpoint, dropping queries as they run out of pages.
+      """
+      assert self.endpoints.search_api, "search_api endpoint template not configured"
+
+      search_api, index_name, using_queries, headers = self._search_context()
+      assert using_queries, "batch search requires the /queries endpoint"
+
+      post_headers = {**headers, "Content-Type": "application/json"}
+      index_b = index_name.encode()
+      size_b = str(page_size).encode()
+      suffix_b = self._algolia_static_suffix
+
+      page = 0
+      active = list(queries)
+      while active:
+         page_b = str(page).encode()
+         body = b'{"requests":[' + b",".join(
+            _ALGOLIA_REQ_TMPL % (index_b, q.encode(), size_b, page_b, suffix_b)
+            for q in active
+         ) + b"]}"
+         resp = await self.request("POST", search_api, content=body, headers=post_headers)
+         js = json_loads(resp.content)
+         results = js.get("results") or []
+
+         still_active: List[str] = []
+         for q, result in zip(active, results):
+            if not isinstance(result, dict):
+               continue
+            items = result.get("hits") or []
+            nb_pages = result.get("nbPages")
+            count = 0
+            for it in items:
+               coalesced = self._coerce_algolia_hit(it)
+               rec = self._normalize_api_item(coalesced)
+               if rec:
+                  count += 1
+                  yield rec
+            if nb_pages is not None and page + 1 >= nb_pages:
+               continue
+            if count < page_size:
+               continue
+            still_active.append(q)
+         active = still_active
          page += 1
-         await asyncio.sleep(0.05)
 
    def _extract_items_from_api(self, js: Dict[str, Any]) -> List[Dict[str, Any]]:
       if not isinstance(js, dict):
@@ -313,20 +739,26 @@ class NintendoAdapter(Adapter):
       return []
 
    def _normalize_api_item(self, it: Dict[str, Any]) -> Optional[GameRecord]:
+      get = it.get
+
+      # UUID: NSUID preferred if present. Check it before normalization so
+      # duplicates skip the regex-heavy title/price cleanup entirely.
+      uuid = _first(get, _ID_KEYS)
+      if uuid:
+         uuid = str(uuid)
+         if uuid in self._seen_ids:
+            return None
+         self._seen_ids.add(uuid)
+
       # Titles often under "title", "name", or "productTitle"
-      name = strip_edition_noise(clean_title(
-         it.get("title") or it.get("name") or it.get("productTitle") or ""
-      ))
+      name = strip_edition_noise(clean_title(_first(get, _NAME_KEYS) or ""))
       if not name:
          return None
 
       # Image fields: hero, boxArt, imageUrl, keyImages[]
-      image = (
-         it.get("image") or it.get("imageUrl") or it.get("boxArt") or it.get("heroBanner") or
-         it.get("productImage") or it.get("productImageSquare")
-      )
+      image = _first(get, _IMAGE_KEYS)
       if not image:
-         imgs = it.get("images") or it.get("keyImages") or []
+         imgs = _first(get, _IMAGE_LIST_KEYS) or []
          if isinstance(imgs, list) and imgs:
             # prefer box art if tagged, else first
             preferred = None
@@ -342,19 +774,16 @@ class NintendoAdapter(Adapter):
       image = _normalize_asset_url(str(image)) if image else "https://www.nintendo.com/etc.clientlibs/ncom/clientlibs/clientlib-ncom/resources/img/nintendo_red.svg"
 
       # Href: product page URL (or build from slug/nsuid)
-      href = (
-         it.get("productUrl") or it.get("url") or it.get("webUrl")
-      )
+      href = _first(get, _HREF_KEYS)
       if not href:
-         slug = it.get("slug") or it.get("seoName")
-         nsuid = it.get("nsuid") or it.get("id")
-         loc = self.config.locale.replace("_", "-").lower()
+         slug = get("slug") or get("seoName")
+         nsuid = get("nsuid") or get("id")
          if slug:
-            href = f"https://www.nintendo.com/{loc}/store/products/{slug}/"
+            href = f"{self._slug_base}{slug}/"
          elif nsuid:
-            href = f"https://www.nintendo.com/{loc}/store/products/{nsuid}/"
+            href = f"{self._slug_base}{nsuid}/"
          else:
-            href = f"https://www.nintendo.com/{loc}/store/"
+            href = f"https://www.nintendo.com/{self._loc}/store/"
 
       if href and isinstance(href, str):
          if href.startswith("//"):
@@ -366,44 +795,43 @@ class NintendoAdapter(Adapter):
 
       # Price normalization
       # We prefer display strings when Nintendo provides them ("Free", "$59.99", etc.).
+      price_obj = get("price") or {}
       display = (
-         (it.get("price") or {}).get("display") or
-         it.get("displayPrice") or
-         it.get("priceDisplay")
+         (price_obj.get("display") if isinstance(price_obj, dict) else None) or
+         get("displayPrice") or get("priceDisplay")
       )
       amount = None
       currency = None
-      price_obj = it.get("price") or {}
       if isinstance(price_obj, dict):
          # Possible numeric fields: "regular", "discounted", "current", "amount"
-         amt = price_obj.get("discounted") or price_obj.get("current") or price_obj.get("regular") or price_obj.get("amount")
+         amt = _first(price_obj.get, _PRICE_AMOUNT_KEYS)
          try:
             amount = float(amt) if amt is not None else None
          except Exception:
             amount = None
          currency = price_obj.get("currency") or price_obj.get("currencyCode")
-      eshop_details = it.get("eshopDetails") if isinstance(it.get("eshopDetails"), dict) else {}
+      eshop_details = get("eshopDetails") if isinstance(get("eshopDetails"), dict) else {}
       if isinstance(price_obj, dict):
          amt_guess, cur_guess, disp_guess = _extract_price_components(price_obj, eshop_details)
          amount = amount or amt_guess
          currency = currency or cur_guess
-         if not isinstance(display, string_types()) and disp_guess:
+         if not isinstance(display, str) and disp_guess:
             display = disp_guess
-      if not isinstance(display, string_types()) and isinstance(eshop_details, dict):
+      if not isinstance(display, str) and isinstance(eshop_details, dict):
          maybe_flag = eshop_details.get("goldPointOfferType")
          if maybe_flag:
             display = maybe_flag
-      price_str = display if isinstance(display, string_types()) else price_to_string(amount, currency)
+      price_str = display if isinstance(display, str) else price_to_string(amount, currency)
 
       # Platforms: almost always "Switch" for Nintendo store data
-      platforms = it.get("platforms") or it.get("platform") or []
+      platforms = get("platforms") or get("platform") or []
       if isinstance(platforms, str):
          platforms = [platforms]
       if not platforms:
          platforms = ["Switch"]
       platforms = normalize_platforms(platforms)
 
-      raw_rating = it.get("rating") or it.get("ratings")
+      raw_rating = get("rating") or get("ratings")
       if isinstance(raw_rating, dict):
          raw_rating = raw_rating.get("display") or raw_rating.get("name")
       elif isinstance(raw_rating, list) and raw_rating:
@@ -412,8 +840,11 @@ class NintendoAdapter(Adapter):
             raw_rating = cand.get("display") or cand.get("name")
       rating = normalize_rating(raw_rating)
 
-      # UUID: NSUID preferred if present
-      uuid = it.get("nsuid") or it.get("id") or it.get("productId")
+      if not uuid:
+         key = hash((name, str(href)))
+         if key in self._seen_name_href:
+            return None
+         self._seen_name_href.add(key)
 
       return GameRecord(
          store="nintendo",
@@ -421,7 +852,7 @@ class NintendoAdapter(Adapter):
          price=price_str,
          image=image,
          href=str(href),
-         uuid=str(uuid) if uuid else None,
+         uuid=uuid or None,
          platforms=platforms,
          rating=rating,
          type="game",
@@ -430,43 +861,48 @@ class NintendoAdapter(Adapter):
    # ---------- Strategy B: HTML + embedded JSON ----------
 
    async def _iter_list_page(self, url: str) -> AsyncIterator[Optional[GameRecord]]:
-      html = await self.get_text(url, headers={"Accept": "text/html"})
+      # Kept as bytes end to end: only the embedded JSON fragments are ever
+      # decoded, not the multi-MB page around them.
+      html = await self.get_bytes(url, headers={"Accept": "text/html"})
+      # Substring probes run at memory bandwidth; a page with neither marker
+      # has nothing to extract, so don't ship multi-MB HTML to the pool.
+      if _NEXT_SENTINEL_B not in html and _JSONLD_SENTINEL_B not in html:
+         return
+      # Listing pages run to several MB; extraction happens in a worker
+      # process and only normalization runs on the loop.
+      loop = asyncio.get_running_loop()
+      next_items, jsonld_blocks = await loop.run_in_executor(
+         self._ensure_parse_pool(), _extract_raw_items, html
+      )
       # 1) __NEXT_DATA__
-      for rec in self._parse_next_data(html, base_url=url):
-         yield rec
+      coerce = self._coerce_to_api_like
+      normalize = self._normalize_api_item
+      for it in next_items:
+         rec = normalize(coerce(it, url))
+         if rec:
+            yield rec
       # 2) JSON-LD
-      for rec in self._parse_jsonld(html, base_url=url):
-         yield rec
-
-   def _parse_next_data(self, html: str, *, base_url: str) -> List[Optional[GameRecord]]:
-      out: List[Optional[GameRecord]] = []
-      m = _NEXT_RE.search(html)
-      if not m:
-         return out
-      try:
-         js = json.loads(m.group(1))
-      except Exception:
-         return out
-
-      # Walk the Next.js tree to locate product arrays
-      def walk(o: Any):
-         if isinstance(o, dict):
-            # frequent keys: "products", "items", "results", "tiles"
-            for key in ("products", "items", "results", "tiles"):
-               v = o.get(key)
-               if isinstance(v, list):
-                  for it in v:
-                     rec = self._normalize_api_item(self._coerce_to_api_like(it, base_url))
-                     if rec:
-                        out.append(rec)
-            for v in o.values():
-               walk(v)
-         elif isinstance(o, list):
-            for v in o:
-               walk(v)
-
-      walk(js)
-      return out
+      for b in jsonld_blocks:
+         rec = self._normalize_jsonld_item(b, url)
+         if rec:
+            yield rec
+
+   def _ensure_parse_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+      if self._parse_pool is None:
+         self._parse_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1)
+         )
+      return self._parse_pool
+
+   def _parse_next_data(self, html: str, *, base_url: str) -> Iterator[GameRecord]:
+      # Generator so records flow out as they normalize instead of buffering
+      # a whole page's worth first.
+      coerce = self._coerce_to_api_like
+      normalize = self._normalize_api_item
+      for it in _extract_next_items(html):
+         rec = normalize(coerce(it, base_url))
+         if rec:
+            yield rec
 
    def _coerce_to_api_like(self, it: Any, base_url: str) -> Dict[str, Any]:
       """
@@ -474,35 +910,37 @@ class NintendoAdapter(Adapter):
       """
       if not isinstance(it, dict):
          return {}
+      get = it.get
       guess: Dict[str, Any] = {}
 
       # name/title
-      guess["title"] = it.get("title") or it.get("name") or it.get("productTitle") or ""
+      guess["title"] = _first(get, _NAME_KEYS) or ""
 
       # image(s)
-      if it.get("imageUrl") or it.get("image"):
-         guess["imageUrl"] = it.get("imageUrl") or it.get("image")
+      image = get("imageUrl") or get("image")
+      if image:
+         guess["imageUrl"] = image
       else:
-         imgs = it.get("images") or it.get("keyImages") or []
+         imgs = _first(get, _IMAGE_LIST_KEYS)
          if imgs:
             guess["keyImages"] = imgs
 
       # link
-      link = it.get("url") or it.get("href") or it.get("productUrl")
+      link = _first(get, _TILE_LINK_KEYS)
       guess["productUrl"] = link or base_url
 
       # price (can be object or display string)
-      price = it.get("price") or it.get("displayPrice") or it.get("priceDisplay")
+      price = _first(get, _TILE_PRICE_KEYS)
       if isinstance(price, dict):
          guess["price"] = price
       elif isinstance(price, str):
          guess["displayPrice"] = price
 
       # ids
-      guess["nsuid"] = it.get("nsuid") or it.get("id") or it.get("productId")
+      guess["nsuid"] = _first(get, _ID_KEYS)
 
       # platforms
-      plats = it.get("platforms")
+      plats = get("platforms")
       if isinstance(plats, list):
          guess["platforms"] = normalize_platforms(plats)
       elif isinstance(plats, str):
@@ -511,34 +949,75 @@ class NintendoAdapter(Adapter):
       return guess
 
    def _coerce_algolia_hit(self, hit: Any) -> Dict[str, Any]:
+      """
+      Coerce one Algolia hit, specialized for the index's stable schema.
+
+      Real hits carry title/nsuid/boxArt/url/price/platforms/esrb under those
+      exact names; hitting them directly skips the long fallback chains the
+      permissive path pays per field. Anything missing a core key drops to
+      the permissive path, so odd hits still normalize.
+      """
       if not isinstance(hit, dict):
          return {}
+      get = hit.get
+      title = get("title")
+      nsuid = get("nsuid")
+      url = get("url")
+      if title and nsuid and url:
+         guess: Dict[str, Any] = {"title": title, "nsuid": nsuid, "productUrl": url}
+         image = get("boxArt")
+         if image:
+            guess["image"] = _normalize_asset_url(str(image))
+         price = get("price")
+         if price is not None:
+            amt, cur, disp = _extract_price_components(price)
+            currency = cur or (price.get("currency") if isinstance(price, dict) else None)
+            if amt is not None or currency:
+               guess["price"] = {"amount": amt, "currency": currency}
+            if disp:
+               guess["displayPrice"] = disp
+            elif isinstance(price, str):
+               guess["displayPrice"] = price
+         plats = get("platforms") or get("corePlatforms")
+         if isinstance(plats, list):
+            guess["platforms"] = normalize_platforms(plats)
+         elif isinstance(plats, str):
+            guess["platforms"] = normalize_platforms([plats])
+         rating = get("esrb")
+         if isinstance(rating, dict):
+            rating = rating.get("label") or rating.get("code")
+         if rating:
+            guess["ratings"] = rating
+         return guess
+      return self._coerce_hit_permissive(hit)
+
+   def _coerce_hit_permissive(self, hit: Dict[str, Any]) -> Dict[str, Any]:
+      # Fallback for hits (and Next.js tiles routed here) that stray from the
+      # Algolia schema; dict.get is bound once and fallback chains run
+      # through _first over key tuples.
+      get = hit.get
       guess: Dict[str, Any] = {}
 
-      slug = hit.get("slug") or hit.get("urlKey")
+      slug = get("slug") or get("urlKey")
       if slug:
          guess.setdefault("slug", slug)
 
-      guess["title"] = hit.get("title") or hit.get("name") or hit.get("productTitle") or ""
-      guess["nsuid"] = hit.get("nsuid") or hit.get("id") or hit.get("productId")
+      guess["title"] = _first(get, _NAME_KEYS) or ""
+      guess["nsuid"] = _first(get, _ID_KEYS)
 
-      image = (
-         hit.get("boxArt") or hit.get("heroBanner") or hit.get("image") or
-         hit.get("productImage") or hit.get("productImageSquare")
-      )
+      image = _first(get, _ALGOLIA_IMAGE_KEYS)
       if image:
          guess["image"] = _normalize_asset_url(str(image))
 
-      link = hit.get("url") or hit.get("productUrl")
+      link = get("url") or get("productUrl")
       if not link and slug:
-         loc = self.config.locale.replace("_", "-").lower()
-         link = f"https://www.nintendo.com/{loc}/store/products/{slug}/"
+         link = f"{self._slug_base}{slug}/"
       guess["productUrl"] = link or None
 
-      price = hit.get("price") or hit.get("prices") or {}
-      eshop_details = hit.get("eshopDetails") if isinstance(hit.get("eshopDetails"), dict) else {}
+      price = get("price") or get("prices") or {}
+      eshop_details = get("eshopDetails") if isinstance(get("eshopDetails"), dict) else {}
       amt, cur, disp = _extract_price_components(price, eshop_details)
-      currency = cur or (price.get("currency") if isinstance(price, dict) else None) or hit.get("currency") or hit.get("currencyCode")
+      currency = cur or (price.get("currency") if isinstance(price, dict) else None) or get("currency") or get("currencyCode")
       if amt is not None or currency:
          guess["price"] = {"amount": amt, "currency": currency}
       if disp:
@@ -546,17 +1025,17 @@ class NintendoAdapter(Adapter):
       elif isinstance(price, str):
          guess["displayPrice"] = price
 
-      display_price = hit.get("priceDisplay") or hit.get("price_display") or hit.get("priceText")
+      display_price = _first(get, _DISPLAY_PRICE_KEYS)
       if display_price and "displayPrice" not in guess:
          guess["displayPrice"] = display_price
 
-      plats = hit.get("platforms") or hit.get("platform") or hit.get("corePlatforms")
+      plats = get("platforms") or get("platform") or get("corePlatforms")
       if isinstance(plats, list):
          guess["platforms"] = normalize_platforms(plats)
       elif isinstance(plats, str):
          guess["platforms"] = normalize_platforms([plats])
 
-      rating = hit.get("rating") or hit.get("esrb") or hit.get("ageRating") or hit.get("contentRating")
+      rating = _first(get, _RATING_KEYS)
       if isinstance(rating, dict):
          rating = rating.get("label") or rating.get("code")
       if rating:
@@ -564,35 +1043,22 @@ class NintendoAdapter(Adapter):
 
       return guess
 
-   def _parse_jsonld(self, html: str, *, base_url: str) -> List[Optional[GameRecord]]:
-      out: List[Optional[GameRecord]] = []
-      for m in _JSONLD_RE.finditer(html):
-         try:
-            block = json.loads(m.group(1))
-         except Exception:
-            continue
-         blocks = block if isinstance(block, list) else [block]
-         for b in blocks:
-            if not isinstance(b, dict):
-               continue
-            # Accept Product/VideoGame schemas, or walk @graph
-            types = {str(b.get("@type","")).lower()}
-            if "@graph" in b and isinstance(b["@graph"], list):
-               for g in b["@graph"]:
-                  if not isinstance(g, dict):
-                     continue
-                  t = str(g.get("@type","")).lower()
-                  if t in {"product","videogame"}:
-                     rec = self._normalize_jsonld_item(g, base_url)
-                     if rec:
-                        out.append(rec)
-            elif types & {"product","videogame"}:
-               rec = self._normalize_jsonld_item(b, base_url)
-               if rec:
-                  out.append(rec)
-      return out
+   def _parse_jsonld(self, html: str, *, base_url: str) -> Iterator[GameRecord]:
+      for b in _extract_jsonld_blocks(html):
+         rec = self._normalize_jsonld_item(b, base_url)
+         if rec:
+            yield rec
 
    def _normalize_jsonld_item(self, b: Dict[str, Any], base_url: str) -> Optional[GameRecord]:
+      # NSUID is sometimes available in JSON-LD (not guaranteed); dedup on it
+      # before paying for title normalization.
+      uuid = _first(b.get, _JSONLD_ID_KEYS)
+      if uuid:
+         uuid = str(uuid)
+         if uuid in self._seen_ids:
+            return None
+         self._seen_ids.add(uuid)
+
       name = strip_edition_noise(clean_title(b.get("name") or ""))
       if not name:
          return None
@@ -616,8 +1082,11 @@ class NintendoAdapter(Adapter):
       # Nintendo output is primarily Switch
       platforms: List[str] = normalize_platforms(["Switch"])
 
-      # NSUID is sometimes available in JSON-LD (not guaranteed)
-      uuid = b.get("sku") or b.get("productID") or b.get("mpn") or None
+      if not uuid:
+         key = hash((name, str(href)))
+         if key in self._seen_name_href:
+            return None
+         self._seen_name_href.add(key)
 
       return GameRecord(
          store="nintendo",
@@ -625,15 +1094,8 @@ class NintendoAdapter(Adapter):
          price=price_str,
          image=str(image) if image else "https://www.nintendo.com/etc.clientlibs/ncom/clientlibs/clientlib-ncom/resources/img/nintendo_red.svg",
          href=str(href),
-         uuid=str(uuid) if uuid else None,
+         uuid=uuid or None,
          platforms=platforms,
          rating=None,
          type="game",
       )
-
-# Small helper to check str-ness in a typed way
-def string_types():
-   try:
-      return (str,)
-   except Exception:
-      return (str,)
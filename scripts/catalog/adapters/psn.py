@@ -1,13 +1,17 @@
 from __future__ import annotations
 import asyncio
-import json
+import concurrent.futures
+import io
+import os
 import re
 import uuid
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import AsyncIterator, Dict, Any, List, Optional, Set
-from urllib.parse import quote, quote_plus, urlparse, parse_qs
+from urllib.parse import quote, quote_plus
 
 from catalog.adapters.base import Adapter, AdapterConfig, Capabilities
+from catalog.http import json_loads
 from catalog.models import GameRecord
 from catalog.normalize import (
    clean_title,
@@ -17,6 +21,11 @@ from catalog.normalize import (
    normalize_rating,
 )
 
+try:
+   import ijson
+except ImportError:
+   ijson = None
+
 # Notes:
 # - PSN's public surface has changed multiple times (legacy "valkyrie" / "chihiro",
 #   Next.js app with __NEXT_DATA__, etc.). This adapter is defensive:
@@ -28,12 +37,292 @@ from catalog.normalize import (
 #
 # - Out of the box, the fallback will work for most list pages that embed Next.js data.
 
-_JSONLD_RE = re.compile(r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.S | re.I)
-_NEXT_RE   = re.compile(r'<script[^>]+id=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>', re.S | re.I)
-_UUID_RE   = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
+# Script bodies are matched with a tempered pattern — runs of non-'<' chars,
+# letting '<' through only when it does not open </script> — so the engine
+# never backtracks across a multi-MB page the way a DOTALL '.*?' can.
+_SCRIPT_BODY = r'([^<]*(?:<(?!/script>)[^<]*)*)</script>'
+_NEXT_RE   = re.compile(r'<script[^>]+id=["\']__NEXT_DATA__["\'][^>]*>' + _SCRIPT_BODY, re.I)
+# Category discovery runs over the raw __NEXT_DATA__ text: one C-level
+# findall for UUID-shaped categoryId/id values replaces a second JSON parse
+# plus a full-tree walk per seed page.
+_CATEGORY_ID_SCAN_RE = re.compile(
+   r'"(?:categoryId|id)"\s*:\s*'
+   r'"([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})"',
+   re.I,
+)
 
 CATEGORY_GRID_HASH = "257713466fc3264850aa473409a29088e3a4115e6e69e9fb3e061c8dd5b9f5c6"
 
+# The persisted-query extensions blob never varies, so its quoted JSON is
+# built once instead of being re-serialized on every grid page.
+_EXTENSIONS_ENCODED = quote(
+   '{"persistedQuery":{"version":1,"sha256Hash":"' + CATEGORY_GRID_HASH + '"}}'
+)
+
+# The variables blob has a fixed shape too; only id/size/offset change per
+# page, so a %-format fills them in without a dict build plus json.dumps.
+_VARS_TEMPLATE = (
+   '{"id":"%s","pageArgs":{"size":%d,"offset":%d},'
+   '"sortBy":{"name":"productReleaseDate","isAscending":false},'
+   '"filterBy":[],"facetOptions":[]}'
+)
+
+# Fixed literals located with str.find (C-level substring search); the
+# regexes above remain only as a fallback for odd markup.
+_NEXT_SENTINEL = '__NEXT_DATA__'
+_JSONLD_SENTINEL = 'application/ld+json'
+_SCRIPT_CLOSE = '</script>'
+
+# Bytes twins: seed pages are scanned undecoded and only the JSON fragments
+# (a few percent of a multi-MB page) ever pay for UTF-8 decoding.
+_NEXT_SENTINEL_B = _NEXT_SENTINEL.encode()
+_JSONLD_SENTINEL_B = _JSONLD_SENTINEL.encode()
+_SCRIPT_CLOSE_B = _SCRIPT_CLOSE.encode()
+_SCRIPT_BODY_B = rb'([^<]*(?:<(?!/script>)[^<]*)*)</script>'
+_NEXT_RE_B = re.compile(rb'<script[^>]+id=["\']__NEXT_DATA__["\'][^>]*>' + _SCRIPT_BODY_B, re.I)
+_CATEGORY_ID_SCAN_RE_B = re.compile(_CATEGORY_ID_SCAN_RE.pattern.encode(), re.I)
+
+def _scan_category_ids(payload) -> List[str]:
+   """findall UUID-shaped categoryId/id values from a str or bytes payload."""
+   if isinstance(payload, bytes):
+      return [m.decode("ascii") for m in _CATEGORY_ID_SCAN_RE_B.findall(payload)]
+   return _CATEGORY_ID_SCAN_RE.findall(payload)
+
+def _find_next_data_payload(html):
+   if isinstance(html, bytes):
+      sentinel, gt, close, fallback = _NEXT_SENTINEL_B, b">", _SCRIPT_CLOSE_B, _NEXT_RE_B
+   else:
+      sentinel, gt, close, fallback = _NEXT_SENTINEL, ">", _SCRIPT_CLOSE, _NEXT_RE
+   i = html.find(sentinel)
+   if i < 0:
+      return None
+   j = html.find(gt, i)
+   if j >= 0:
+      k = html.find(close, j + 1)
+      if k >= 0:
+         return html[j + 1:k]
+   # Sentinel present but the fast scan lost its bearings: odd markup, let
+   # the regex have a try.
+   m = fallback.search(html)
+   return m.group(1) if m else None
+
+def _iter_script_payloads(html):
+   """
+   Single pass over <script> tags, yielding ('next'|'jsonld', body) pairs.
+
+   Routing on the opening tag's attributes lets one traversal feed both
+   extraction strategies instead of re-scanning the page per sentinel.
+   Accepts str or bytes; bodies come back in the input's type so only the
+   JSON fragments ever get decoded downstream.
+   """
+   if isinstance(html, bytes):
+      open_tag, gt = b"<script", b">"
+      close, next_sentinel, jsonld_sentinel = (
+         _SCRIPT_CLOSE_B, _NEXT_SENTINEL_B, _JSONLD_SENTINEL_B)
+   else:
+      open_tag, gt = "<script", ">"
+      close, next_sentinel, jsonld_sentinel = (
+         _SCRIPT_CLOSE, _NEXT_SENTINEL, _JSONLD_SENTINEL)
+   pos = 0
+   find = html.find
+   while True:
+      i = find(open_tag, pos)
+      if i < 0:
+         return
+      j = find(gt, i)
+      if j < 0:
+         return
+      k = find(close, j + 1)
+      if k < 0:
+         return
+      attrs = html[i:j]
+      if next_sentinel in attrs:
+         yield "next", html[j + 1:k]
+      elif jsonld_sentinel in attrs:
+         yield "jsonld", html[j + 1:k]
+      pos = k + len(close)
+
+# PSN catalogs repeat titles heavily (editions/bundles of the same base
+# game) and draw platforms from a handful of strings, so the regex-heavy
+# normalize pipeline is memoized on its raw inputs.
+@lru_cache(maxsize=8192)
+def _clean_name(raw: str) -> str:
+   return strip_edition_noise(clean_title(raw))
+
+@lru_cache(maxsize=256)
+def _platforms_cached(platforms: tuple) -> tuple:
+   return tuple(normalize_platforms(list(platforms)))
+
+# Keys under which PSN Next.js trees stash product arrays.
+_NEXT_ITEM_KEYS = ("products", "results")
+_NEXT_ITEM_SUFFIXES = tuple(f"{key}.item" for key in _NEXT_ITEM_KEYS)
+_NEXT_ITEM_DOTTED = tuple(f".{suffix}" for suffix in _NEXT_ITEM_SUFFIXES)
+
+def _stream_next_data_items(payload):
+   """Stream dicts out of product arrays without materializing the full tree."""
+   if not isinstance(payload, bytes):
+      payload = payload.encode("utf-8")
+   builder = None
+   depth = 0
+   for prefix, event, value in ijson.parse(io.BytesIO(payload)):
+      if builder is not None:
+         builder.event(event, value)
+         if event in ("start_map", "start_array"):
+            depth += 1
+         elif event in ("end_map", "end_array"):
+            depth -= 1
+            if depth == 0:
+               item = builder.value
+               builder = None
+               if isinstance(item, dict):
+                  yield item
+      elif event == "start_map" and (
+         prefix in _NEXT_ITEM_SUFFIXES or prefix.endswith(_NEXT_ITEM_DOTTED)
+      ):
+         builder = ijson.ObjectBuilder()
+         builder.event(event, value)
+         depth = 1
+
+def _iter_next_data_items(payload):
+   """
+   Yield candidate product dicts from a __NEXT_DATA__ payload.
+
+   With ijson available only the matching product arrays are materialized;
+   otherwise the whole payload is parsed and walked.
+   """
+   if ijson is not None:
+      yield from _stream_next_data_items(payload)
+      return
+   try:
+      js = json_loads(payload)
+   except Exception:
+      return
+   yield from _walk_product_items(js)
+
+# Fallback key orders for the heterogeneous item shapes we normalize.
+_NAME_KEYS = ("name", "title", "productName")
+_HREF_KEYS = ("url", "productUrl", "webUrl")
+_ID_KEYS = ("id", "skuId", "productId", "contentId")
+_PLATFORM_KEYS = ("platforms", "playablePlatforms")
+
+def _first(get, keys):
+   """Return the first truthy value among *keys* via a bound dict.get."""
+   for k in keys:
+      v = get(k)
+      if v:
+         return v
+   return None
+
+def _next_link_offset(links: Any, page_size: int) -> Optional[int]:
+   """
+   Pull the next offset out of a pagination links dict.
+
+   The query-parameter names are known, so direct substring slicing replaces
+   a urlparse + parse_qs round trip (a dict allocation per response).
+   """
+   if not isinstance(links, dict):
+      return None
+   for key in ("next", "nextPage", "nextPageUrl"):
+      href = links.get(key)
+      if not isinstance(href, str):
+         continue
+      for marker, scale in (("offset=", 1), ("start=", 1), ("page=", page_size)):
+         i = href.find(marker)
+         if i < 0 or (i > 0 and href[i - 1] not in "?&"):
+            continue
+         value = href[i + len(marker):].split("&", 1)[0]
+         try:
+            return int(value) * scale
+         except ValueError:
+            continue
+   return None
+
+_WANTED_TYPES = frozenset({"product", "videogame"})
+
+def _jsonld_blocks(payload) -> List[Dict[str, Any]]:
+   """Decode one JSON-LD payload (str or bytes) and return its Product/VideoGame blocks."""
+   out: List[Dict[str, Any]] = []
+   # Most JSON-LD on these pages is breadcrumb/organization noise; a
+   # substring test rejects those without paying for a JSON parse.
+   if isinstance(payload, bytes):
+      if b"Product" not in payload and b"VideoGame" not in payload:
+         return out
+   elif "Product" not in payload and "VideoGame" not in payload:
+      return out
+   try:
+      block = json_loads(payload)
+   except Exception:
+      return out
+   # JSON-LD may be a dict or a list of dicts
+   blocks = block if isinstance(block, list) else [block]
+   for b in blocks:
+      # Only consider Product/Game-like schemas
+      if not isinstance(b, dict):
+         continue
+      if (b.get("@type") or "").lower() in _WANTED_TYPES:
+         out.append(b)
+         continue
+      # Sometimes an array under "@graph"
+      for g in (b.get("@graph") or []):
+         if isinstance(g, dict) and (g.get("@type") or "").lower() in _WANTED_TYPES:
+            out.append(g)
+   return out
+
+def _extract_raw_items(html):
+   """
+   CPU-bound extraction of embedded JSON from a seed page (str or bytes).
+
+   Top-level and side-effect free so it can run in a worker process;
+   normalization, which needs adapter state, stays on the event loop.
+   One script-tag scan feeds both strategies and category discovery.
+   """
+   next_items: List[Any] = []
+   jsonld_blocks: List[Dict[str, Any]] = []
+   category_ids: Set[str] = set()
+   saw_next = False
+   for kind, payload in _iter_script_payloads(html):
+      if kind == "next":
+         saw_next = True
+         category_ids.update(_scan_category_ids(payload))
+         try:
+            next_items.extend(_iter_next_data_items(payload))
+         except Exception:
+            pass
+      else:
+         jsonld_blocks.extend(_jsonld_blocks(payload))
+   sentinel = _NEXT_SENTINEL_B if isinstance(html, bytes) else _NEXT_SENTINEL
+   if not saw_next and sentinel in html:
+      # Odd markup (sentinel outside a script attribute): regex fallback.
+      payload = _find_next_data_payload(html)
+      if payload is not None:
+         category_ids.update(_scan_category_ids(payload))
+         try:
+            next_items.extend(_iter_next_data_items(payload))
+         except Exception:
+            pass
+   return next_items, jsonld_blocks, category_ids
+
+def _walk_product_items(o: Any):
+   """Yield raw entries of every products/results array nested in *o*."""
+   # Next.js trees run to megabytes; an explicit stack avoids a Python
+   # frame per node, and matched arrays are not descended into twice.
+   stack = [o]
+   pop = stack.pop
+   while stack:
+      node = pop()
+      if isinstance(node, dict):
+         get = node.get
+         for key in _NEXT_ITEM_KEYS:
+            v = get(key)
+            if isinstance(v, list):
+               yield from v
+         for k, v in node.items():
+            if k in _NEXT_ITEM_KEYS and isinstance(v, list):
+               continue
+            stack.append(v)
+      elif isinstance(node, list):
+         stack.extend(node)
+
 @dataclass(slots=True)
 class PSNEndpoints:
    # GraphQL category grid endpoint and known category ids (if any)
@@ -70,9 +359,26 @@ class PSNAdapter(Adapter):
          seed_pages=_default_seed_pages(self.config.country, self.config.locale),
       )
       self._resume_keys: Set[str] = set()
-
-   def _locale_path(self) -> str:
-      return self.config.locale.replace("_", "-").lower()
+      # Content digests of seed pages parsed this run; the default seeds
+      # overlap heavily and identical payloads are not worth re-parsing.
+      self._seen_digests: Set[int] = set()
+      # Locale-derived strings are constant per run; derive them once here
+      # instead of re-running replace/lower/upper in every header and URL.
+      self._locale_dashed = self.config.locale.replace("_", "-")
+      self._locale = self._locale_dashed.lower()
+      self._language = self._locale.split("-")[0]
+      self._country_upper = self.config.country.upper()
+      # Fallback strings rebuilt per item before; they never change per run.
+      self._store_base = f"https://store.playstation.com/{self._locale}"
+      self._default_image = "https://store.playstation.com/assets/cover-placeholder.png"
+      # Created lazily by _ensure_parse_pool; only seed-page crawls need it.
+      self._parse_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+   async def __aexit__(self, exc_type, exc, tb):
+      if self._parse_pool is not None:
+         self._parse_pool.shutdown(wait=False, cancel_futures=True)
+         self._parse_pool = None
+      await super().__aexit__(exc_type, exc, tb)
 
    # ---------- public contract ----------
 
@@ -80,40 +386,51 @@ class PSNAdapter(Adapter):
       seen: Set[str] = set()
       discovered_category_ids: Set[str] = set(self.endpoints.category_ids or [])
 
-      # Strategy A: GraphQL category grids (if ids are known up-front)
-      for cid in list(discovered_category_ids):
-         async for rec in self._iter_category_grid(cid):
+      # Strategy A: GraphQL category grids (if ids are known up-front). The
+      # grids are independent paginators against one host, so fan them out;
+      # the domain limiter and per-page sleeps keep the request rate polite.
+      sources = [self._iter_category_grid(cid) for cid in sorted(discovered_category_ids)]
+      if sources:
+         async for rec in self.merge_streams(sources):
             if rec and self._mark_seen(rec, seen):
                yield rec
-         await asyncio.sleep(0.1)
 
-      # Strategy B: Search API (optional). Demonstrated with A-Z seeds if provided.
+      # Strategy B: Search API (optional). Demonstrated with A-Z seeds if
+      # provided. The 26 letter streams are independent, so fan them out via
+      # merge_streams; the domain limiter keeps the request rate polite while
+      # concurrency hides per-request latency.
       if self.endpoints.search_api:
-         # paginate letters 'a'..'z' (tweak to your needs)
-         for ch in "abcdefghijklmnopqrstuvwxyz":
-            async for rec in self._iter_search_api(query=ch, page_size=50):
-               if rec and self._mark_seen(rec, seen):  # could be None if malformed
-                  yield rec
-            # brief polite pause between seed letters
-            await asyncio.sleep(0.1)
+         sources = [
+            self._iter_search_api(query=ch, page_size=50)
+            for ch in "abcdefghijklmnopqrstuvwxyz"
+         ]
+         async for rec in self.merge_streams(sources):
+            if rec and self._mark_seen(rec, seen):  # could be None if malformed
+               yield rec
 
-      # Strategy C: Fallback to HTML pages with embedded JSON
-      for url in self.endpoints.seed_pages or []:
-         async for rec in self._iter_seed_page(url, discovered_category_ids):
+      # Strategy C: Fallback to HTML pages with embedded JSON, also fanned
+      # out (pages are few but heavy, so overlapping them matters most).
+      sources = [
+         self._iter_seed_page(url, discovered_category_ids)
+         for url in self.endpoints.seed_pages or []
+      ]
+      if sources:
+         async for rec in self.merge_streams(sources):
             if rec and self._mark_seen(rec, seen):
                yield rec
-         # be nice between heavy pages
-         await asyncio.sleep(0.2)
 
-      # Strategy D: GraphQL category grids discovered from seed pages
-      for cid in sorted(discovered_category_ids):
-         if cid in (self.endpoints.category_ids or []):
-            # already processed above
-            continue
-         async for rec in self._iter_category_grid(cid):
+      # Strategy D: GraphQL category grids discovered from seed pages, fanned
+      # out the same way (ids already covered by Strategy A are skipped).
+      known = set(self.endpoints.category_ids or [])
+      sources = [
+         self._iter_category_grid(cid)
+         for cid in sorted(discovered_category_ids)
+         if cid not in known
+      ]
+      if sources:
+         async for rec in self.merge_streams(sources):
             if rec and self._mark_seen(rec, seen):
                yield rec
-         await asyncio.sleep(0.1)
 
    def resume(self, records: List[GameRecord]) -> None:
       super().resume(records)
@@ -138,20 +455,42 @@ class PSNAdapter(Adapter):
       return True
 
    def _record_key(self, rec: GameRecord) -> Optional[str]:
-      candidates = (
-         rec.uuid,
-         rec.href,
-         rec.name and f"{rec.store}:{rec.name}",
-      )
-      return next((value for value in map(lambda candidate: candidate, candidates) if value), None)
+      # Runs once per record on large crawls; a short-circuit or-chain skips
+      # the name f-string entirely in the common case where uuid is set.
+      return rec.uuid or rec.href or (f"{rec.store}:{rec.name}" if rec.name else None)
 
    async def _iter_seed_page(self, url: str, discovered_category_ids: Set[str]) -> AsyncIterator[Optional[GameRecord]]:
-      html = await self.get_text(url, headers={"Accept": "text/html"}, params=None)
-      discovered_category_ids.update(self._extract_category_ids(html))
-      for rec in self._parse_next_data(html, base_url=url):
-         yield rec
-      for rec in self._parse_jsonld(html, base_url=url):
-         yield rec
+      # Raw bytes: the scanners accept them directly, so the multi-MB body
+      # skips the UTF-8 decode and only embedded JSON fragments are decoded.
+      html = await self.get_bytes(url, headers={"Accept": "text/html"}, params=None)
+      # Same body as an earlier seed → same records; skip the parse entirely.
+      digest = hash(html)
+      if digest in self._seen_digests:
+         return
+      self._seen_digests.add(digest)
+      # Seed pages run to several MB; extraction (scan + JSON parse + walk)
+      # happens in a worker process so the event loop keeps draining other
+      # requests, and only normalization runs here.
+      loop = asyncio.get_running_loop()
+      next_items, jsonld_blocks, category_ids = await loop.run_in_executor(
+         self._ensure_parse_pool(), _extract_raw_items, html
+      )
+      discovered_category_ids.update(category_ids)
+      for it in next_items:
+         rec = self._normalize_next_item(it, url)
+         if rec:
+            yield rec
+      for b in jsonld_blocks:
+         rec = self._normalize_jsonld_item(b, url)
+         if rec:
+            yield rec
+
+   def _ensure_parse_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+      if self._parse_pool is None:
+         self._parse_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1)
+         )
+      return self._parse_pool
 
    # ---------- Strategy A: JSON search API (optional) ----------
 
@@ -164,20 +503,18 @@ class PSNAdapter(Adapter):
 
       headers = {
          "Accept": "application/json",
-         "X-PSN-Store-Locale": self._locale_path(),
-         "Referer": f"https://store.playstation.com/{self._locale_path()}",
+         "X-PSN-Store-Locale": self._locale,
+         "Referer": self._store_base,
       }
 
-      locale = self.config.locale.replace("_", "-")
-      language = locale.split("-")[0]
       offset = 0
       while True:
          url = self.endpoints.search_api.format(
             query=quote_plus(query),
             size=page_size,
-            country=self.config.country.upper(),
-            language=language,
-            lang=locale,
+            country=self._country_upper,
+            language=self._language,
+            lang=self._locale_dashed,
             offset=offset,
          )
          js = await self.get_json(url, headers=headers)
@@ -190,52 +527,30 @@ class PSNAdapter(Adapter):
             if rec:
                count += 1
                yield rec
-         next_offset = None
-         links = js.get("links") or {}
-         if isinstance(links, dict):
-            for key in ("next", "nextPage", "nextPageUrl"):
-               href = links.get(key)
-               if not isinstance(href, str):
-                  continue
-               try:
-                  parsed = urlparse(href)
-               except Exception:
-                  parsed = None
-               if not parsed:
-                  continue
-               qs = parse_qs(parsed.query)
-               for qk in ("offset", "start"):
-                  if qk in qs and qs[qk]:
-                     try:
-                        next_offset = int(qs[qk][0])
-                        break
-                     except Exception:
-                        next_offset = None
-               if next_offset is None and "page" in qs and qs["page"]:
-                  try:
-                     next_offset = int(qs["page"][0]) * page_size
-                  except Exception:
-                     next_offset = None
-               if next_offset is not None:
-                  break
-            if next_offset is not None:
-               offset = next_offset
-               await asyncio.sleep(0.05)
-               continue
+         # Explicit total first: plain integer arithmetic, no allocations,
+         # and most responses carry it. The links fallback only runs when
+         # the server gave us nothing cheaper to go on.
          total = js.get("total_results") or js.get("totalResults") or js.get("total")
          if total is not None:
             try:
                total = int(total)
             except Exception:
                total = None
-         if total is not None and (offset + count) < total:
-            offset += count or page_size
-            await asyncio.sleep(0.05)
-            continue
+         if total is not None:
+            if (offset + count) < total:
+               offset += count or page_size
+               await asyncio.sleep(0.05)
+               continue
+            break
          if count >= page_size:
             offset += count
             await asyncio.sleep(0.05)
             continue
+         next_offset = _next_link_offset(js.get("links"), page_size)
+         if next_offset is not None and next_offset > offset:
+            offset = next_offset
+            await asyncio.sleep(0.05)
+            continue
          break
 
    def _normalize_api_item(self, it: Dict[str, Any]) -> Optional[GameRecord]:
@@ -243,40 +558,39 @@ class PSNAdapter(Adapter):
       Normalize an item returned by a JSON search API variant.
       Adjust keys to match your region’s actual payload.
       """
-      # Common-ish fields seen across PSN JSON variants:
-      name = strip_edition_noise(clean_title(it.get("name") or it.get("title") or ""))
+      # Common-ish fields seen across PSN JSON variants. Hot path: dict.get
+      # is bound once and fallback chains run through _first over key tuples.
+      get = it.get
+      name = _clean_name(_first(get, _NAME_KEYS) or "")
       if not name:
          return None
 
       # image (prefer hero/cover)
-      image = (
-         it.get("image") or
-         it.get("media", {}).get("thumbnailUrl") or
-         (it.get("keyImages") or [{}])[0].get("url") or
-         ""
-      )
+      image = get("image")
+      if not image:
+         media = get("media")
+         if isinstance(media, dict):
+            image = media.get("thumbnailUrl")
+      if not image:
+         key_images = get("keyImages")
+         if key_images:
+            image = key_images[0].get("url")
 
       # url / href
-      href = (
-         it.get("url") or
-         it.get("productUrl") or
-         it.get("webUrl") or
-         ""
-      )
+      href = _first(get, _HREF_KEYS) or ""
 
       # price normalization (display prices are often present)
-      display = (
-         (it.get("price") or {}).get("display") or
-         it.get("displayPrice") or
-         None
-      )
-      # fallback to amount+currency if present
+      price_obj = get("price") or {}
+      display = None
       amount = None
       currency = None
-      price_obj = it.get("price") or {}
       if isinstance(price_obj, dict):
-         amount = price_obj.get("discounted") or price_obj.get("current") or price_obj.get("amount")
-         currency = price_obj.get("currency")
+         price_get = price_obj.get
+         display = price_get("display")
+         amount = price_get("discounted") or price_get("current") or price_get("amount")
+         currency = price_get("currency")
+      if not display:
+         display = get("displayPrice")
 
       if display and isinstance(display, str):
          price_str = display
@@ -285,16 +599,16 @@ class PSNAdapter(Adapter):
 
       # platforms
       platforms: List[str] = []
-      for p in (it.get("platforms") or it.get("playablePlatforms") or []):
+      for p in (_first(get, _PLATFORM_KEYS) or []):
          if isinstance(p, dict):
             platforms.append(p.get("name") or p.get("platform") or "")
          else:
             platforms.append(str(p))
-      platforms = normalize_platforms(platforms)
+      platforms = list(_platforms_cached(tuple(platforms)))
 
       # rating (ESRB-like)
       rating = None
-      ratings = it.get("rating") or it.get("ratings") or {}
+      ratings = get("rating") or get("ratings") or {}
       if isinstance(ratings, dict):
          rating = ratings.get("display") or ratings.get("ageRating")
       elif isinstance(ratings, list) and ratings:
@@ -302,13 +616,10 @@ class PSNAdapter(Adapter):
 
       rating = normalize_rating(rating)
 
-      uuid = (
-         it.get("id") or it.get("skuId") or it.get("productId") or
-         it.get("contentId") or None
-      )
+      uuid = _first(get, _ID_KEYS)
 
-      image = str(image) if image else "https://store.playstation.com/assets/cover-placeholder.png"
-      href = str(href) if href else f"https://store.playstation.com/{self._locale_path()}"
+      image = str(image) if image else self._default_image
+      href = str(href) if href else self._store_base
 
       return GameRecord(
          store="psn",
@@ -324,39 +635,47 @@ class PSNAdapter(Adapter):
 
    # ---------- Strategy B: HTML + embedded JSON ----------
 
+   def _grid_page_url(self, category_id: str, page_size: int, offset: int) -> str:
+      variables = quote(_VARS_TEMPLATE % (category_id, page_size, offset))
+      return (
+         f"{self.endpoints.category_grid_api}?operationName=categoryGridRetrieve"
+         f"&variables={variables}"
+         f"&extensions={_EXTENSIONS_ENCODED}"
+      )
+
+   async def _iter_grid_page(self, category_id: str, page_size: int, offset: int,
+                             headers: Dict[str, str]) -> AsyncIterator[GameRecord]:
+      """Fetch one grid page and yield its normalized records."""
+      js = await self.get_json(self._grid_page_url(category_id, page_size, offset),
+                               headers=headers)
+      grid = ((js.get("data") or {}).get("categoryGridRetrieve") or {})
+      products = grid.get("products") or []
+      if isinstance(products, list):
+         for raw in products:
+            rec = self._normalize_category_grid_item(raw)
+            if rec:
+               yield rec
+
    async def _iter_category_grid(self, category_id: str, *, page_size: int = 24) -> AsyncIterator[Optional[GameRecord]]:
       """Iterate products from the categoryGridRetrieve GraphQL endpoint."""
-      base_locale = self._locale_path()
+      # One id per paginator serves both headers: correlation ids are meant
+      # to group a session's requests anyway, and uuid4 reads urandom per call.
+      req_id = str(uuid.uuid4())
       headers = {
          "Accept": "application/json",
          "Content-Type": "application/json",
          "Origin": "https://store.playstation.com",
-         "Referer": f"https://store.playstation.com/{base_locale}",
-         "X-PSN-Store-Locale-Override": base_locale,
+         "Referer": self._store_base,
+         "X-PSN-Store-Locale-Override": self._locale,
          "apollographql-client-version": "0.0.1",
-         "x-psn-request-id": str(uuid.uuid4()),
-         "x-psn-correlation-id": str(uuid.uuid4()),
+         "x-psn-request-id": req_id,
+         "x-psn-correlation-id": req_id,
       }
 
       offset = 0
       while True:
-         variables = {
-            "id": category_id,
-            "pageArgs": {"size": page_size, "offset": offset},
-            "sortBy": {"name": "productReleaseDate", "isAscending": False},
-            "filterBy": [],
-            "facetOptions": [],
-         }
-         extensions = {
-            "persistedQuery": {"version": 1, "sha256Hash": CATEGORY_GRID_HASH}
-         }
-         query = (
-            f"{self.endpoints.category_grid_api}?operationName=categoryGridRetrieve"
-            f"&variables={quote(json.dumps(variables, separators=(',', ':')))}"
-            f"&extensions={quote(json.dumps(extensions, separators=(',', ':')))}"
-         )
-
-         js = await self.get_json(query, headers=headers)
+         js = await self.get_json(self._grid_page_url(category_id, page_size, offset),
+                                  headers=headers)
          grid = ((js.get("data") or {}).get("categoryGridRetrieve") or {})
          products = grid.get("products") or []
          yielded = 0
@@ -372,30 +691,45 @@ class PSNAdapter(Adapter):
          total_count = page_info.get("totalCount") if isinstance(page_info, dict) else None
          has_next = page_info.get("hasNextPage") if isinstance(page_info, dict) else None
 
+         # With an authoritative totalCount on the first page, every remaining
+         # offset is known up-front and the pages are independent — fan them
+         # out instead of paying one round trip per page. Pacing stays with
+         # the domain limiter; concurrency is kept modest for one host.
+         if offset == 0 and yielded and isinstance(total_count, int):
+            if total_count <= yielded:
+               return
+            sources = [
+               self._iter_grid_page(category_id, page_size, off, headers)
+               for off in range(page_size, total_count, page_size)
+            ]
+            async for rec in self.merge_streams(sources, concurrency=4):
+               yield rec
+            return
+
+         # Single deterministic advance: trust nextOffset when the server
+         # provides it, otherwise step by what was yielded only while
+         # hasNextPage or the running total says there is more. The
+         # full-page guess applies only when pageInfo gave no signal at
+         # all, so an explicit hasNextPage=false can no longer be overruled
+         # into fetching a duplicate page.
          if isinstance(next_offset, int) and next_offset > offset:
-            offset = next_offset
-            await asyncio.sleep(0.1)
-            continue
-
-         if has_next and yielded:
-            offset += yielded
-            await asyncio.sleep(0.1)
-            continue
-
-         if total_count is not None and isinstance(total_count, int) and (offset + yielded) < total_count and yielded:
-            offset += yielded
-            await asyncio.sleep(0.1)
-            continue
-
-         if yielded >= page_size:
-            offset += yielded
-            await asyncio.sleep(0.1)
-            continue
+            advance = next_offset
+         elif yielded and (
+            has_next or (isinstance(total_count, int) and (offset + yielded) < total_count)
+         ):
+            advance = offset + yielded
+         elif yielded >= page_size and has_next is None and total_count is None:
+            advance = offset + yielded
+         else:
+            advance = None
 
-         break
+         if advance is None or advance == offset:
+            break
+         offset = advance
+         await asyncio.sleep(0.1)
 
    def _normalize_category_grid_item(self, it: Dict[str, Any]) -> Optional[GameRecord]:
-      name = strip_edition_noise(clean_title(it.get("name") or ""))
+      name = _clean_name(it.get("name") or "")
       if not name:
          return None
 
@@ -417,14 +751,14 @@ class PSNAdapter(Adapter):
       else:
          price_str = price_to_string(None, None)
 
-      platforms = normalize_platforms(it.get("platforms") or [])
+      platforms = list(_platforms_cached(tuple(it.get("platforms") or ())))
       rating = normalize_rating(it.get("localizedStoreDisplayClassification"))
 
       return GameRecord(
          store="psn",
          name=name,
          price=price_str or "",
-         image=image or "https://store.playstation.com/assets/cover-placeholder.png",
+         image=image or self._default_image,
          href=href,
          uuid=str(it.get("id")) if it.get("id") else None,
          platforms=platforms,
@@ -433,119 +767,77 @@ class PSNAdapter(Adapter):
       )
 
    def _build_product_url(self, product_id: Optional[str]) -> str:
-      base = f"https://store.playstation.com/{self._locale_path()}"
       if product_id:
-         return f"{base}/product/{product_id}"
-      return base
+         return f"{self._store_base}/product/{product_id}"
+      return self._store_base
+
+   # Preferred media roles, best first; grid items carry ~6 media entries so
+   # a single ranked scan beats re-walking the list once per role.
+   _MEDIA_ROLE_RANK = {
+      "MASTER": 0,
+      "GAMEHUB_COVER_ART": 1,
+      "EDITION_KEY_ART": 2,
+      "BACKGROUND": 3,
+      "FOUR_BY_THREE_BANNER": 4,
+      "PORTRAIT_BANNER": 5,
+   }
 
    def _choose_media_image(self, media: List[Dict[str, Any]]) -> Optional[str]:
-      priorities = (
-         "MASTER",
-         "GAMEHUB_COVER_ART",
-         "EDITION_KEY_ART",
-         "BACKGROUND",
-         "FOUR_BY_THREE_BANNER",
-         "PORTRAIT_BANNER",
-      )
-      for role in priorities:
-         for item in media:
-            if not isinstance(item, dict):
-               continue
-            if item.get("type") == "IMAGE" and item.get("role") == role and item.get("url"):
-               return str(item["url"])
+      rank_of = self._MEDIA_ROLE_RANK.get
+      best_rank = 99
+      best_url = None
+      fallback = None
       for item in media:
-         if isinstance(item, dict) and item.get("type") == "IMAGE" and item.get("url"):
-            return str(item["url"])
-      return None
-
-   def _extract_category_ids(self, html: str) -> Set[str]:
-      ids: Set[str] = set()
-      m = _NEXT_RE.search(html)
-      if not m:
-         return ids
-      try:
-         js = json.loads(m.group(1))
-      except Exception:
-         return ids
-
-      def walk(o: Any):
-         if isinstance(o, dict):
-            candidate = o.get("categoryId") or o.get("id")
-            if isinstance(candidate, str) and _UUID_RE.match(candidate):
-               ids.add(candidate)
-            for v in o.values():
-               walk(v)
-         elif isinstance(o, list):
-            for v in o:
-               walk(v)
-
-      walk(js)
-      return ids
-
-   def _parse_next_data(self, html: str, *, base_url: str) -> List[Optional[GameRecord]]:
-      out: List[Optional[GameRecord]] = []
-      m = _NEXT_RE.search(html)
-      if not m:
-         return out
-      try:
-         js = json.loads(m.group(1))
-      except Exception:
-         return out
+         if not isinstance(item, dict) or item.get("type") != "IMAGE":
+            continue
+         url = item.get("url")
+         if not url:
+            continue
+         if fallback is None:
+            fallback = url
+         rank = rank_of(item.get("role"), 99)
+         if rank < best_rank:
+            best_rank = rank
+            best_url = url
+            if rank == 0:
+               break
+      url = best_url or fallback
+      return str(url) if url else None
 
-      # Next.js trees vary; walk for plausible product arrays
-      def walk(o: Any):
-         if isinstance(o, dict):
-            # common product-ish keys
-            if "products" in o and isinstance(o["products"], list):
-               for it in o["products"]:
-                  rec = self._normalize_next_item(it, base_url)
-                  if rec:
-                     out.append(rec)
-            # sometimes "results" holds products
-            if "results" in o and isinstance(o["results"], list):
-               for it in o["results"]:
-                  rec = self._normalize_next_item(it, base_url)
-                  if rec:
-                     out.append(rec)
-            for v in o.values():
-               walk(v)
-         elif isinstance(o, list):
-            for v in o:
-               walk(v)
-
-      walk(js)
-      return out
+   def _extract_category_ids(self, html) -> Set[str]:
+      payload = _find_next_data_payload(html)
+      if payload is None:
+         return set()
+      return set(_scan_category_ids(payload))
 
    def _normalize_next_item(self, it: Dict[str, Any], base_url: str) -> Optional[GameRecord]:
       # Many Next.js props mirror API objects; reuse the API normalizer when possible.
       # Map fields into a simpler dict and pass through _normalize_api_item.
       guess: Dict[str, Any] = {}
+      get = it.get
 
       # name / title
-      guess["name"] = (
-         it.get("name") or it.get("title") or
-         it.get("productName") or ""
-      )
+      guess["name"] = _first(get, _NAME_KEYS) or ""
 
       # urls
-      guess["url"] = (
-         it.get("url") or it.get("productUrl") or
-         (base_url if base_url else None)
-      )
+      guess["url"] = get("url") or get("productUrl") or (base_url if base_url else None)
 
       # image / media
-      img = (
-         it.get("image") or
-         it.get("thumbnail") or
-         it.get("media", {}).get("thumbnailUrl") or
-         (it.get("keyImages") or [{}])[0].get("url")
-      )
+      img = get("image") or get("thumbnail")
+      if not img:
+         media = get("media")
+         if isinstance(media, dict):
+            img = media.get("thumbnailUrl")
+      if not img:
+         key_images = get("keyImages")
+         if key_images:
+            img = key_images[0].get("url")
       if img:
          guess["image"] = img
 
       # platforms (PS4/PS5)
       plats = []
-      psrc = it.get("platforms") or it.get("playablePlatforms") or it.get("platform") or []
+      psrc = _first(get, _PLATFORM_KEYS) or get("platform") or []
       if isinstance(psrc, list):
          for p in psrc:
             if isinstance(p, dict):
@@ -554,7 +846,7 @@ class PSNAdapter(Adapter):
                plats.append(str(p))
       elif isinstance(psrc, str):
          plats = [psrc]
-      guess["platforms"] = normalize_platforms(plats)
+      guess["platforms"] = list(_platforms_cached(tuple(plats)))
 
       # price
       price = it.get("price") or {}
@@ -570,43 +862,18 @@ class PSNAdapter(Adapter):
                guess["price"] = {"amount": amt, "currency": price.get("currency")}
 
       # rating
-      rating = it.get("rating") or it.get("ratings")
+      rating = get("rating") or get("ratings")
       if rating:
          guess["rating"] = rating
 
       # ids
-      guess["id"] = it.get("id") or it.get("skuId") or it.get("productId") or it.get("contentId")
+      guess["id"] = _first(get, _ID_KEYS)
 
       return self._normalize_api_item(guess)
 
-   def _parse_jsonld(self, html: str, *, base_url: str) -> List[Optional[GameRecord]]:
-      out: List[Optional[GameRecord]] = []
-      for m in _JSONLD_RE.finditer(html):
-         try:
-            block = json.loads(m.group(1))
-         except Exception:
-            continue
-         # JSON-LD may be a dict or a list of dicts
-         blocks = block if isinstance(block, list) else [block]
-         for b in blocks:
-            # Only consider Product/Game-like schemas
-            if not isinstance(b, dict):
-               continue
-            if (b.get("@type") or "").lower() not in {"product", "videogame"}:
-               # Sometimes an array under "@graph"
-               for g in (b.get("@graph") or []):
-                  if isinstance(g, dict) and (g.get("@type") or "").lower() in {"product", "videogame"}:
-                     rec = self._normalize_jsonld_item(g, base_url)
-                     if rec:
-                        out.append(rec)
-               continue
-            rec = self._normalize_jsonld_item(b, base_url)
-            if rec:
-               out.append(rec)
-      return out
-
    def _normalize_jsonld_item(self, b: Dict[str, Any], base_url: str) -> Optional[GameRecord]:
-      name = strip_edition_noise(clean_title(b.get("name") or ""))
+      raw_name = b.get("name") or ""
+      name = _clean_name(raw_name)
       if not name:
          return None
 
@@ -626,19 +893,20 @@ class PSNAdapter(Adapter):
       price_str = price_to_string(amt, currency)
       href = b.get("url") or base_url
 
-      # Platforms: JSON-LD often lacks detailed platform info; leave empty or infer from url
+      # Platforms: JSON-LD often lacks detailed platform info; infer from the
+      # raw name. The inferred values are already canonical, so the
+      # normalize_platforms round trip is skipped.
       platforms: List[str] = []
-      if "PlayStation 5" in (b.get("name") or ""):
+      if "PlayStation 5" in raw_name:
          platforms.append("PS5")
-      if "PlayStation 4" in (b.get("name") or ""):
+      if "PlayStation 4" in raw_name:
          platforms.append("PS4")
-      platforms = normalize_platforms(platforms)
 
       return GameRecord(
          store="psn",
          name=name,
          price=price_str,
-         image=str(image) if image else "https://store.playstation.com/assets/cover-placeholder.png",
+         image=str(image) if image else self._default_image,
          href=str(href),
          uuid=None,
          platforms=platforms,
@@ -650,22 +918,31 @@ class PSNAdapter(Adapter):
       children: Dict[str, List[GameRecord]] = {"ps4": [], "ps5": []}
 
       for rec in rows:
-         platforms = [p.lower() for p in rec.platforms]
-         include_ps4 = any("ps4" in plat for plat in platforms)
-         include_ps5 = any("ps5" in plat for plat in platforms)
+         # One pass over the platforms, no lowercased throwaway list; most
+         # records match a single platform so the early break usually fires.
+         include_ps4 = include_ps5 = False
+         for p in rec.platforms:
+            pl = p.lower()
+            if not include_ps4 and "ps4" in pl:
+               include_ps4 = True
+            if not include_ps5 and "ps5" in pl:
+               include_ps5 = True
+            if include_ps4 and include_ps5:
+               break
 
+         # Only store/extra differ from the parent record, so a shallow copy
+         # with overrides beats deep-copying every unchanged field. Sharing
+         # the other fields by reference is fine: downstream only reads them.
          if include_ps4:
-            child = rec.model_copy(deep=True)
-            child.store = "ps4"
-            child.extra = dict(child.extra)
-            child.extra.setdefault("source_store", self.store)
-            children["ps4"].append(child)
+            children["ps4"].append(rec.model_copy(update={
+               "store": "ps4",
+               "extra": {"source_store": self.store, **rec.extra},
+            }))
 
          if include_ps5:
-            child = rec.model_copy(deep=True)
-            child.store = "ps5"
-            child.extra = dict(child.extra)
-            child.extra.setdefault("source_store", self.store)
-            children["ps5"].append(child)
+            children["ps5"].append(rec.model_copy(update={
+               "store": "ps5",
+               "extra": {"source_store": self.store, **rec.extra},
+            }))
 
       return {name: items for name, items in children.items() if items}
@@ -1,19 +1,31 @@
 from __future__ import annotations
-import asyncio
+import io
 import json
 import os
 from pathlib import Path
-from typing import AsyncIterator, Dict, Any, List, Optional, Set
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Any, List, Optional, Set
+
+if TYPE_CHECKING:
+   from catalog.db import AppDetailsCache
 
 from catalog.adapters.base import Adapter, AdapterConfig, Capabilities
+from catalog.http import json_loads
 from catalog.models import GameRecord
 from catalog.normalize import clean_title, strip_edition_noise, price_to_string
 
+try:
+   import ijson
+except ImportError:
+   ijson = None
+
 API_FEATURED = "https://store.steampowered.com/api/featuredcategories"
 API_DETAILS = "https://store.steampowered.com/api/appdetails"
 API_APP_LIST_V2 = "https://api.steampowered.com/ISteamApps/GetAppList/v2/"
 API_APP_LIST_V1 = "https://api.steampowered.com/IStoreService/GetAppList/v1/"
 
+# appdetails platform flags → canonical labels.
+_PLATFORM_KEYS = (("windows", "Windows"), ("mac", "Mac"), ("linux", "Linux"))
+
 class SteamAdapter(Adapter):
    """
    Steam adapter (no auth required).
@@ -35,6 +47,7 @@ class SteamAdapter(Adapter):
                 buckets: Optional[List[str]] = None,        # override featured buckets
                 app_list_url: Optional[str] = None,
                 api_key: Optional[str] = None,
+                details_cache: "AppDetailsCache | None" = None,
                 **kw):
       if config is None:
          config = AdapterConfig()
@@ -50,9 +63,17 @@ class SteamAdapter(Adapter):
       self._app_list_url = (API_APP_LIST_V1 if self._use_v1 else API_APP_LIST_V2)
       skip_path = os.getenv("STEAM_SKIP_FILE")
       self._skip_file = Path(skip_path) if skip_path else Path(__file__).with_name(".steamignore")
-      self._skip_appids: Set[str] = self._load_skip_appids()
+      # Ints, not strings: half the memory for a big skip set and trivial
+      # hashing on the membership check that runs once per listed appid.
+      self._skip_appids: Set[int] = self._load_skip_appids()
+      # Newly discovered skips buffer here and hit disk in batches instead
+      # of one open/append/close per filtered appid.
+      self._pending_skips: List[int] = []
       self._request_count = 0
       self._resume_appids: Set[str] = set()
+      # Optional (appid, cc) disk cache; warm runs then only fetch new or
+      # stale appids instead of re-hitting appdetails for the whole list.
+      self._details_cache = details_cache
 
    async def iter_games(self) -> AsyncIterator[GameRecord]:
       # Step 1: seed appids from the global Steam app list, fallback to featured categories
@@ -61,28 +82,39 @@ class SteamAdapter(Adapter):
          featured = await self.get_json(API_FEATURED, params={"l": "english"})
          appids = self._extract_featured_appids(featured, self.buckets)
 
-      # Step 2: hydrate via appdetails (region-aware pricing via cc)
-      seen: Set[str] = set()
+      # Step 2: hydrate via appdetails (region-aware pricing via cc). The
+      # per-appid calls are independent and latency-bound, so they fan out
+      # through merge_streams; the domain limiter still paces the host.
+      pending: List[str] = []
       for appid in appids:
          if appid in self._resume_appids:
             self._resume_appids.discard(appid)
             continue
          if self.skip_appid(appid):
             continue
-
-         data = await self._fetch_appdetails(appid)
-         if not data:
-            continue
-
-         rec = self._normalize_app(appid, data)
-         if rec:
-            key = self._record_key(rec)
-            if key and key in seen:
+         pending.append(appid)
+      pending = await self._prescreen_appids(pending)
+      if not pending:
+         return
+
+      async def hydrate(ids: List[str]) -> AsyncIterator[GameRecord]:
+         for appid in ids:
+            data = await self._fetch_appdetails(appid)
+            if data:
+               rec = self._normalize_app(appid, data)
+               if rec:
+                  yield rec
+
+      workers = max(1, min(self.config.concurrency, len(pending)))
+      sources = [hydrate(pending[i::workers]) for i in range(workers)]
+      seen: Set[str] = set()
+      async for rec in self.merge_streams(sources):
+         key = self._record_key(rec)
+         if key:
+            if key in seen:
                continue
-            if key:
-               seen.add(key)
-            yield rec
-         await asyncio.sleep(0.05)  # polite jitter between app calls
+            seen.add(key)
+         yield rec
 
    def resume(self, records: List[GameRecord]) -> None:
       super().resume(records)
@@ -93,10 +125,12 @@ class SteamAdapter(Adapter):
             self._resume_appids.add(str(record.uuid))
 
    async def request(self, method: str, url: str, **kw):
+      # Pacing belongs to the shared domain limiter (1 rps sustained with a
+      # small burst); a fixed post-request sleep on top of it only stacked a
+      # second rate cap per worker.
       kw.setdefault("retry_429_wait", 15.0)
       response = await super().request(method, url, **kw)
       self._request_count += 1
-      await asyncio.sleep(1.0)
       return response
 
    # ---------------- helpers ----------------
@@ -106,16 +140,14 @@ class SteamAdapter(Adapter):
          return await self._fetch_paginated_app_list_ids()
 
       params = self._app_list_params()
-      js: Optional[Dict[str, Any]] = None
       try:
-         js = await self.get_json(self._app_list_url, params=params)
+         raw = await self.get_bytes(self._app_list_url, params=params)
+         return self._extract_appids_from_raw(raw, seen=set())
       except Exception:
          js = self._load_local_app_list()
-
-      if not js:
-         return []
-
-      return self._extract_appids_from_response(js, seen=set())
+         if not js:
+            return []
+         return self._extract_appids_from_response(js, seen=set())
 
    async def _fetch_paginated_app_list_ids(self) -> List[str]:
       max_results = 50000
@@ -127,16 +159,16 @@ class SteamAdapter(Adapter):
       while True:
          params = self._app_list_params(last_appid=last_appid, max_results=max_results)
          try:
-            js = await self.get_json(self._app_list_url, params=params)
+            raw = await self.get_bytes(self._app_list_url, params=params)
+            page_ids = self._extract_appids_from_raw(raw, seen=seen)
          except Exception:
             if ids:
                break
             js = self._load_local_app_list()
             used_local = bool(js)
-         if not js:
-            break
-
-         page_ids = self._extract_appids_from_response(js, seen=seen)
+            if not js:
+               break
+            page_ids = self._extract_appids_from_response(js, seen=seen)
          if not page_ids:
             break
 
@@ -153,6 +185,29 @@ class SteamAdapter(Adapter):
 
       return ids
 
+   def _extract_appids_from_raw(self, raw: bytes, *, seen: Set[str]) -> List[str]:
+      """
+      Pull appids straight out of a raw app-list body.
+
+      The full list runs to tens of MB and ~200k entries; with ijson the
+      appids stream out without ever materializing a per-app dict tree,
+      otherwise the body is parsed whole and walked as before.
+      """
+      if ijson is None:
+         return self._extract_appids_from_response(json_loads(raw), seen=seen)
+      #        ↓ App-List v1                   ↓ App-List v2
+      path = "response.apps.item.appid" if self._use_v1 else "applist.apps.item.appid"
+      ids: List[str] = []
+      for appid in ijson.items(io.BytesIO(raw), path):
+         if not isinstance(appid, int):
+            continue
+         appid_str = str(appid)
+         if appid_str in seen:
+            continue
+         seen.add(appid_str)
+         ids.append(appid_str)
+      return ids
+
    def _extract_appids_from_response(self, js: Dict[str, Any], *, seen: Set[str]) -> List[str]:
       #           ↓ App-List v2        ↓ App-List v1
       apps = (((  js.get("applist") or js.get("response") or {}).get("apps")) or [])
@@ -177,13 +232,21 @@ class SteamAdapter(Adapter):
                ids.append(str(it["id"]))
             except Exception:
                continue
-      # de-dup while preserving order
-      seen = set()
-      return [a for a in ids if not (a in seen or seen.add(a))]
+      # de-dup while preserving order (insertion-ordered dict, all in C)
+      return list(dict.fromkeys(ids))
 
    def _app_list_params(self, *, last_appid: int = 0, max_results: int = 50000) -> Dict[str, Any]:
       if self._use_v1:
          params: Dict[str, Any] = {"max_results": max_results, "last_appid": last_appid}
+         if self.include_types:
+            # IStoreService screens by type server-side. Every appid filtered
+            # here is one appdetails round trip that never happens — most of
+            # the raw list is DLC/tools that _normalize_app would discard.
+            params["include_games"] = int("game" in self.include_types)
+            params["include_dlc"] = int("dlc" in self.include_types)
+            params["include_software"] = int("software" in self.include_types)
+            params["include_videos"] = int("video" in self.include_types)
+            params["include_hardware"] = int("hardware" in self.include_types)
          if self._api_key:
             params["key"] = self._api_key
          return params
@@ -208,25 +271,74 @@ class SteamAdapter(Adapter):
       )
       return next((value for value in map(lambda candidate: candidate, candidates) if value), None)
 
+   async def _prescreen_appids(self, appids: List[str], *, chunk_size: int = 50) -> List[str]:
+      """
+      Cheap type screen before full hydration.
+
+      One appdetails call with filters=basic covers ~50 appids (Steam honors
+      CSV ids when a filter is set), so unwanted types drop out for a
+      fiftieth of the requests a full per-appid hydrate would spend on them.
+      Ids the bulk response says nothing about stay in, to be safe.
+      """
+      if not self.include_types or len(appids) <= 1:
+         return appids
+      survivors: List[str] = []
+      for start in range(0, len(appids), chunk_size):
+         chunk = appids[start:start + chunk_size]
+         try:
+            basics = await self._fetch_appdetails_bulk(chunk, filters="basic")
+         except Exception:
+            survivors.extend(chunk)
+            continue
+         for appid in chunk:
+            data = basics.get(appid)
+            app_type = (data or {}).get("type")
+            if app_type and self.skip_appid(appid, app_type=app_type):
+               continue
+            survivors.append(appid)
+      return survivors
+
+   async def _fetch_appdetails_bulk(self, appids: List[str], *,
+                                    filters: str = "basic") -> Dict[str, Optional[Dict[str, Any]]]:
+      js = await self.get_json(
+         API_DETAILS,
+         params={"appids": ",".join(appids), "l": "english",
+                 "cc": self.config.country, "filters": filters},
+      )
+      out: Dict[str, Optional[Dict[str, Any]]] = {}
+      for appid in appids:
+         payload = js.get(str(appid))
+         out[appid] = (payload.get("data") or None) if payload and payload.get("success") else None
+      return out
+
    async def _fetch_appdetails(self, appid: str) -> Optional[Dict[str, Any]]:
+      cache = self._details_cache
+      if cache is not None:
+         hit, cached = cache.get(appid, self.config.country)
+         if hit:
+            return cached
       js = await self.get_json(
          API_DETAILS,
          params={"appids": appid, "l": "english", "cc": self.config.country}
       )
       payload = js.get(str(appid))
-      if not payload or not payload.get("success"):
-         return None
-      return payload.get("data") or None
+      data = (payload.get("data") or None) if payload and payload.get("success") else None
+      if cache is not None:
+         cache.put(appid, self.config.country, data)
+      return data
 
-   def _load_skip_appids(self) -> Set[str]:
+   def _load_skip_appids(self) -> Set[int]:
       try:
          with self._skip_file.open("r", encoding="utf-8") as fh:
-            ids = set()
+            ids: Set[int] = set()
             for line in fh:
                line = line.strip()
                if not line or line.startswith("#"):
                   continue
-               ids.add(line)
+               try:
+                  ids.add(int(line))
+               except ValueError:
+                  continue
             return ids
       except FileNotFoundError:
          return set()
@@ -234,37 +346,57 @@ class SteamAdapter(Adapter):
          return set()
 
    def skip_appid(self, appid: str, *, app_type: Optional[str] = None) -> bool:
-      appid_str = str(appid)
+      try:
+         aid = int(appid)
+      except (TypeError, ValueError):
+         # Steam appids are numeric; anything else can't be in the skip set.
+         aid = None
       if app_type is None:
-         return appid_str in self._skip_appids
+         return aid in self._skip_appids if aid is not None else False
 
       normalized_type = app_type.lower()
       should_skip = bool(self.include_types) and normalized_type and normalized_type not in self.include_types
-      if should_skip and appid_str not in self._skip_appids:
-         self._skip_appids.add(appid_str)
-         try:
-            self._skip_file.parent.mkdir(parents=True, exist_ok=True)
-            with self._skip_file.open("a", encoding="utf-8") as fh:
-               fh.write(f"{appid_str}\n")
-         except OSError:
-            pass
+      if should_skip and aid is not None and aid not in self._skip_appids:
+         self._skip_appids.add(aid)
+         self._pending_skips.append(aid)
+         if len(self._pending_skips) >= 256:
+            self._flush_pending_skips()
       return should_skip
 
+   def _flush_pending_skips(self) -> None:
+      if not self._pending_skips:
+         return
+      try:
+         self._skip_file.parent.mkdir(parents=True, exist_ok=True)
+         with self._skip_file.open("a", encoding="utf-8") as fh:
+            fh.write("".join(f"{aid}\n" for aid in self._pending_skips))
+      except OSError:
+         # Leave the buffer intact; the next flush (or exit) retries.
+         return
+      self._pending_skips.clear()
+
+   async def __aexit__(self, exc_type, exc, tb):
+      self._flush_pending_skips()
+      await super().__aexit__(exc_type, exc, tb)
+
    def _normalize_app(self, appid: str, app: Dict[str, Any]) -> Optional[GameRecord]:
+      # Hot path: one bound dict.get serves every field below.
+      get = app.get
+
       # Filter by type
-      app_type = (app.get("type") or "").lower()
+      app_type = (get("type") or "").lower()
       if self.include_types and app_type and app_type not in self.include_types:
          self.skip_appid(appid, app_type=app_type)
          return None
 
       # Title
-      name_raw = app.get("name") or ""
+      name_raw = get("name") or ""
       name = strip_edition_noise(clean_title(name_raw))
       if not name:
          return None
 
       # Price string
-      p = app.get("price_overview")
+      p = get("price_overview")
       if isinstance(p, dict):
          # price_overview.final is in cents
          try:
@@ -275,18 +407,15 @@ class SteamAdapter(Adapter):
          # If discount present, we still output the discounted display (no strike-through in schema)
          price_str = price_to_string(amount, currency)
       else:
-         price_str = "Free" if app.get("is_free") else "Unavailable"
+         price_str = "Free" if get("is_free") else "Unavailable"
 
       # Image / href
-      image = app.get("header_image") or ""
+      image = get("header_image") or ""
       href = f"https://store.steampowered.com/app/{appid}"
 
       # Platforms
-      platforms: List[str] = []
-      plat = app.get("platforms") or {}
-      if plat.get("windows"): platforms.append("Windows")
-      if plat.get("mac"):     platforms.append("Mac")
-      if plat.get("linux"):   platforms.append("Linux")
+      plat = get("platforms") or {}
+      platforms = [label for key, label in _PLATFORM_KEYS if plat.get(key)]
 
       # UUID: use appid (string)
       uuid = str(appid)
@@ -301,5 +430,5 @@ class SteamAdapter(Adapter):
          platforms=platforms,
          rating=None,
          type="game" if app_type == "game" else app_type or None,
-         extra={"steam_type": app.get("type")}
+         extra={"steam_type": get("type")}
       )
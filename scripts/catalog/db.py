@@ -39,6 +39,20 @@ class CachedGameRow(Base):
    __table_args__ = (UniqueConstraint("store", "cache_key", name="u_store_cache_key"),)
 
 
+class CachedAppDetailsRow(Base):
+   __tablename__ = "cached_appdetails"
+
+   id = Column(Integer, primary_key=True)
+   appid = Column(String(32), nullable=False)
+   country = Column(String(8), nullable=False)
+   # None records a negative result (missing or unsuccessful appdetails),
+   # so known-bad appids are not re-fetched until the TTL expires.
+   payload = Column(JSON, nullable=True)
+   fetched_at = Column(DateTime(timezone=False), nullable=False, default=datetime.utcnow)
+
+   __table_args__ = (UniqueConstraint("appid", "country", name="u_appid_country"),)
+
+
 def _resolve_url(url: str) -> str:
    return url if "://" in url else f"sqlite:///{url}"
 
@@ -68,6 +82,24 @@ def cache_key_for_record(record: GameRecord) -> str:
    return record.uuid or str(record.href)
 
 
+def _commit_with_retry(session: Session) -> None:
+   retries = 5
+   delay = 0.1
+   for attempt in range(retries):
+      try:
+         session.commit()
+         break
+      except OperationalError as exc:
+         message = str(exc).lower()
+         if "database is locked" not in message:
+            raise
+         session.rollback()
+         if attempt == retries - 1:
+            raise
+         time.sleep(delay)
+         delay *= 2
+
+
 class CatalogCache:
    """Simple helper for persisting adapter progress between runs."""
 
@@ -166,21 +198,77 @@ class CatalogCache:
 
    def flush(self) -> None:
       if self._pending_writes or self._session.new or self._session.dirty:
-         retries = 5
-         delay = 0.1
-         for attempt in range(retries):
-            try:
-               self._session.commit()
-               break
-            except OperationalError as exc:
-               message = str(exc).lower()
-               if "database is locked" not in message:
-                  raise
-               self._session.rollback()
-               if attempt == retries - 1:
-                  raise
-               time.sleep(delay)
-               delay *= 2
+         _commit_with_retry(self._session)
+      self._pending_writes = 0
+
+   def close(self) -> None:
+      try:
+         self.flush()
+      finally:
+         self._session.close()
+
+
+class AppDetailsCache:
+   """
+   TTL'd cache of Steam appdetails payloads keyed by (appid, country).
+
+   appdetails responses rarely change between runs, so a warm run resolves
+   most appids from disk and only new or stale entries hit the network.
+   Negative results are cached too (payload None) to avoid re-fetching
+   appids that Steam reports as unsuccessful.
+   """
+
+   def __init__(self, session: Session, *, ttl_seconds: float = 86400.0,
+                commit_interval: int = 500):
+      self._session = session
+      self._ttl = ttl_seconds
+      self._commit_interval = max(1, commit_interval)
+      self._pending_writes = 0
+
+   def _lookup(self, appid: str, country: str) -> CachedAppDetailsRow | None:
+      with self._session.no_autoflush:
+         return (
+            self._session.execute(
+               select(CachedAppDetailsRow)
+               .where(CachedAppDetailsRow.appid == str(appid))
+               .where(CachedAppDetailsRow.country == country)
+            )
+            .scalars()
+            .first()
+         )
+
+   def get(self, appid: str, country: str) -> tuple[bool, dict | None]:
+      """Return (hit, payload); payload may be None for a cached negative."""
+
+      row = self._lookup(appid, country)
+      if row is None:
+         return False, None
+      if (datetime.utcnow() - row.fetched_at).total_seconds() > self._ttl:
+         return False, None
+      return True, row.payload
+
+   def put(self, appid: str, country: str, payload: dict | None) -> None:
+      now = datetime.utcnow()
+      existing = self._lookup(appid, country)
+      if existing:
+         existing.payload = payload
+         existing.fetched_at = now
+      else:
+         self._session.add(
+            CachedAppDetailsRow(
+               appid=str(appid),
+               country=country,
+               payload=payload,
+               fetched_at=now,
+            )
+         )
+      self._pending_writes += 1
+      if self._pending_writes >= self._commit_interval:
+         self.flush()
+
+   def flush(self) -> None:
+      if self._pending_writes or self._session.new or self._session.dirty:
+         _commit_with_retry(self._session)
       self._pending_writes = 0
 
    def close(self) -> None:
@@ -1,27 +1,63 @@
-import asyncio, random
+import asyncio, json, random
 from contextlib import asynccontextmanager
 import httpx
 from aiolimiter import AsyncLimiter
 
+try:
+   import orjson
+except ImportError:
+   orjson = None
+
+try:
+   import brotli
+except ImportError:
+   brotli = None
+
+# Only advertise encodings we can actually decode: brotli ships with the
+# optional speed extra, and httpx raises mid-response on an undecodable
+# content-encoding rather than at request time.
+_ACCEPT_ENCODING = "gzip, br" if brotli is not None else "gzip"
+
 RETRYABLE = {408, 425, 429, 500, 502, 503, 504}
 
+def json_loads(data):
+   """Parse JSON from bytes or str, preferring orjson when installed."""
+   if orjson is not None:
+      return orjson.loads(data)
+   return json.loads(data)
+
 @asynccontextmanager
 async def make_client(*, timeout: float = 30.0):
-   async with httpx.AsyncClient(http2=True, timeout=timeout, headers={
+   # Generous keep-alive pool: adapters fan out many requests per domain,
+   # and re-handshaking TLS per request costs more than idle sockets.
+   limits = httpx.Limits(
+      max_keepalive_connections=64,
+      max_connections=128,
+      keepalive_expiry=30.0,
+   )
+   async with httpx.AsyncClient(http2=True, timeout=timeout, limits=limits, headers={
       "User-Agent": "game-catalog (contact: maintainer@example.com)",
       "Accept": "application/json, text/html;q=0.9,*/*;q=0.8",
+      "Accept-Encoding": _ACCEPT_ENCODING,
    }) as client:
       yield client
 
 class DomainLimiter:
-   def __init__(self, rps: float):
-      self.limiter = AsyncLimiter(rps, time_period=1)
+   def __init__(self, rps: float, *, burst: float | None = None):
+      # aiolimiter is a leaky bucket holding max_rate capacity per period:
+      # sizing the bucket to `burst` while stretching the period keeps the
+      # sustained rate at `rps` but lets short bursts through, e.g. when a
+      # concurrent fan-out warms the connection pool.
+      if burst and burst > rps:
+         self.limiter = AsyncLimiter(burst, time_period=burst / rps)
+      else:
+         self.limiter = AsyncLimiter(rps, time_period=1)
 
    async def wait(self):
       await self.limiter.acquire()
 
 async def fetch(client: httpx.AsyncClient, method: str, url: str, *,
-                params=None, headers=None, json=None, data=None,
+                params=None, headers=None, json=None, data=None, content=None,
                 limiter: DomainLimiter | None = None,
                 max_retries: int = 5,
                 retry_429_wait: float | None = None) -> httpx.Response:
@@ -37,6 +73,7 @@ async def fetch(client: httpx.AsyncClient, method: str, url: str, *,
             headers=headers,
             json=json,
             data=data,
+            content=content,
             follow_redirects=True,
          )
          if r.status_code in RETRYABLE:
@@ -8,7 +8,7 @@ from catalog.adapters.steam import SteamAdapter
 from catalog.adapters.psn import PSNAdapter
 from catalog.adapters.xbox import XboxAdapter
 from catalog.adapters.nintendo import NintendoAdapter
-from catalog.db import CatalogCache, make_session
+from catalog.db import AppDetailsCache, CatalogCache, make_session
 from catalog.runner import run_adapter
 
 from rich.logging import RichHandler
@@ -17,7 +17,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 log = logging.getLogger("catalog.crawl")
 
 FACTORY = {
-   "steam": lambda c: SteamAdapter(config=c),
+   "steam": lambda c, **kw: SteamAdapter(config=c, **kw),
    "psn": lambda c: PSNAdapter(config=c),
    "xbox": lambda c: XboxAdapter(config=c),
    "nintendo": lambda c: NintendoAdapter(config=c),
@@ -72,17 +72,29 @@ async def main():
    if configured_stores:
       log.info("Starting crawl for %d store(s)", len(configured_stores))
       tasks = []
+      details_caches = []
       with Progress(*progress_columns, transient=False) as progress:
          for s, ctor in configured_stores:
             log.info("Scheduling crawl for %s", s)
             task_id = progress.add_task(f"{s}: pending", start=False, total=None)
             cache_obj = None
+            extras = {}
             if cache_db_url:
                cache_session = make_session(cache_db_url)
                cache_obj = CatalogCache(cache_session, commit_interval=args.cache_commit_interval)
-            tasks.append(run_adapter(ctor(cfg), args.out, progress, task_id, cache=cache_obj, resume=resume_cache))
+               if s == "steam":
+                  # appdetails payloads are reusable across runs; same DB,
+                  # separate session so the two caches commit independently.
+                  details_cache = AppDetailsCache(make_session(cache_db_url))
+                  details_caches.append(details_cache)
+                  extras["details_cache"] = details_cache
+            tasks.append(run_adapter(ctor(cfg, **extras), args.out, progress, task_id, cache=cache_obj, resume=resume_cache))
 
-         await asyncio.gather(*tasks)
+         try:
+            await asyncio.gather(*tasks)
+         finally:
+            for details_cache in details_caches:
+               details_cache.close()
       log.info("All requested stores completed")
    else:
       log.warning("No valid stores requested")